@@ -4,27 +4,193 @@ copyright (c) 2016 Earth Advantage. All rights reserved.
 
 Functionality for calls to external APIs"""
 
-import re
+import base64
+import functools
+import gzip
+import json
+import threading
+import time
+from collections import OrderedDict
 
 import requests
+from requests.adapters import HTTPAdapter
+from requests.auth import HTTPBasicAuth, HTTPDigestAuth
+from urllib3.util.retry import Retry
 
 from pyseed.exceptions import APIClientError
 
+# Constants
+_HTTP_OK = requests.codes.ok
+_HTTP_NOT_MODIFIED = requests.codes.not_modified
+# refresh OAuth access tokens this many seconds before they expire
+_TOKEN_EXPIRY_MARGIN = 30
+_MISSING = object()
+_SESSION_LOCK = threading.Lock()
+# size of the chunks that streamed bodies are sent in
+_STREAM_CHUNK_SIZE = 64 * 1024
+# calls are retried when SEED is busy, POST and PATCH are not retried as
+# they are not idempotent, the methods match urllib3's default
+_RETRY_TOTAL = 3
+_RETRY_BACKOFF = 0.3
+_RETRY_STATUSES = (429, 502, 503, 504)
+_RETRY_METHODS = frozenset(("DELETE", "GET", "HEAD", "OPTIONS", "PUT", "TRACE"))
+
 
 def add_pk(url, pk, required=True, slash=False):
     """Add id/primary key to url"""
-    if required and not pk:
-        raise APIClientError("id/pk must be supplied")
     if pk:
-        if isinstance(pk, str) and not pk.isdigit() or (not isinstance(pk, (int, str)) or int(pk) < 0):
+        # ints are the common case, so check them first
+        if type(pk) is int:
+            if pk < 0:
+                raise TypeError("id/pk must be a positive integer")
+        elif isinstance(pk, str):
+            if not pk.isdigit():
+                raise TypeError("id/pk must be a positive integer")
+        elif not isinstance(pk, int) or pk < 0:
             raise TypeError("id/pk must be a positive integer")
-        url = f"{url}/{pk}" if not url.endswith("/") else f"{url}{pk}"
+        url = f"{url}{pk}" if url.endswith("/") else f"{url}/{pk}"
+    elif required:
+        raise APIClientError("id/pk must be supplied")
     # Only add the trailing slash if it's not already there
     if slash and not url.endswith("/"):
         url = f"{url}/"
     return url
 
 
+def _get_token_expiry(token):
+    """Return the expiry (exp claim) of a JWT access token as a timestamp,
+    0 if it can not be read."""
+    try:
+        claims = token.split(".")[1]
+        # restore the base64 padding stripped from JWTs
+        claims = json.loads(base64.urlsafe_b64decode(claims + "=" * (-len(claims) % 4)))
+        return float(claims["exp"])
+    except (AttributeError, IndexError, KeyError, TypeError, ValueError):
+        return 0
+
+
+@functools.lru_cache(maxsize=1024)
+def _normalize_url(urlstring, use_ssl):
+    """Return urlstring with its http(s):// prefix set to match use_ssl"""
+    # strip http(s):// off url
+    urlstring = urlstring.removeprefix("https://") if urlstring.startswith("https://") else urlstring.removeprefix("http://")
+    start = "https://" if use_ssl else "http://"
+    return f"{start}{urlstring}"
+
+
+class _ResponseCache:
+    """Least recently used cache of responses, entries expire after ttl seconds"""
+
+    def __init__(self, ttl, max_entries):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the cached response or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, response = entry
+            if expires < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return response
+
+    def set(self, key, response):
+        """Cache the response, evicting the least recently used if full"""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all entries"""
+        with self._lock:
+            self._entries.clear()
+
+
+class _HTTPXSession:
+    """Make calls with an httpx.Client, which multiplexes concurrent calls
+    over a single HTTP/2 connection, using the same arguments and method
+    names as a requests.Session."""
+
+    def __init__(self):
+        try:
+            import httpx
+        except ImportError as err:
+            raise APIClientError("The httpx backend requires httpx, install py-seed[http2]") from err
+        self._httpx = httpx
+        # like the requests session, retry connection failures a couple of times
+        transport = httpx.HTTPTransport(
+            http2=True,
+            retries=2,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+        # requests follows redirects by default, httpx does not
+        self.client = httpx.Client(transport=transport, follow_redirects=True)
+
+    def request(self, method, url, auth=None, data=None, stream=False, **kwargs):
+        """Convert requests style arguments to httpx and make the call. With
+        stream the response body is only downloaded as it is read."""
+        if isinstance(auth, HTTPDigestAuth):
+            auth = self._httpx.DigestAuth(auth.username, auth.password)
+        elif isinstance(auth, HTTPBasicAuth):
+            auth = (auth.username, auth.password)
+        retries = _RETRY_TOTAL if method in _RETRY_METHODS else 0
+        if isinstance(data, (bytes, str)):
+            # raw bodies are passed as content in httpx
+            kwargs["content"] = data
+        elif hasattr(data, "read"):
+            # stream file like bodies, e.g., a MultipartEncoder, in chunks
+            kwargs["content"] = iter(functools.partial(data.read, _STREAM_CHUNK_SIZE), b"")
+            if getattr(data, "len", None) is not None:
+                # send the length rather than a chunked body, not all servers accept those
+                kwargs["headers"] = {**(kwargs.get("headers") or {}), "Content-Length": str(data.len)}
+            # streamed bodies can only be sent once
+            retries = 0
+        elif data is not None:
+            kwargs["data"] = data
+        # retry the same calls on the same statuses as the requests session
+        for attempt in range(retries + 1):
+            response = self.client.send(self.client.build_request(method, url, **kwargs), auth=auth, stream=stream)
+            if attempt == retries or response.status_code not in _RETRY_STATUSES:
+                return response
+            response.close()
+            time.sleep(self._retry_delay(response, attempt))
+        return response
+
+    @staticmethod
+    def _retry_delay(response, attempt):
+        """Seconds to wait before retrying, any Retry-After takes priority."""
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return int(retry_after)
+        return _RETRY_BACKOFF * 2**attempt
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self.request("PUT", url, **kwargs)
+
+    def patch(self, url, **kwargs):
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request("DELETE", url, **kwargs)
+
+    def close(self):
+        self.client.close()
+
+
 class BaseAPI:
     """
     Base class for API Calls
@@ -32,7 +198,22 @@ class BaseAPI:
 
     # pylint: disable=too-few-public-methods, too-many-instance-attributes
 
-    def __init__(self, url=None, use_ssl=True, timeout=None, use_json=False, use_auth=False, auth=None, **kwargs):
+    def __init__(
+        self,
+        url=None,
+        use_ssl=True,
+        timeout=None,
+        use_json=False,
+        use_auth=False,
+        auth=None,
+        session=None,
+        cache_ttl=None,
+        cache_max_entries=128,
+        json_encoder=None,
+        backend="requests",
+        conditional_get=False,
+        **kwargs,
+    ):
         # pylint: disable=too-many-arguments
         """Set url,api key, auth usage, ssl usage, timeout etc.
 
@@ -40,6 +221,18 @@ class BaseAPI:
                    be used if it is supplied and does not match `use_ssl`
         :param: use_ssl: connect over https, defaults to True
         :param use_auth: use authentication
+        :param session: requests.Session to reuse, one with connection
+                        pooling is created on first use if not supplied
+        :param cache_ttl: seconds to cache successful GET responses for,
+                          caching is disabled if not set
+        :param cache_max_entries: maximum number of cached GET responses
+        :param json_encoder: callable used to serialize json bodies, e.g.,
+                             orjson.dumps, requests serializes them if not set
+        :param backend: 'requests' (default) or 'httpx' to make calls over
+                        HTTP/2 with httpx, which requires py-seed[http2]
+        :param conditional_get: revalidate GET responses that carry an ETag
+                                or Last-Modified header and reuse them if
+                                the server replies 304 Not Modified
 
         ..Note:
             If `use_auth` is True the default is to use http basic
@@ -63,8 +256,77 @@ class BaseAPI:
         self.auth = auth
         self.url = None
         self.url = self._construct_url(url) if url else None
+        self._session = session
+        self._cache = _ResponseCache(cache_ttl, cache_max_entries) if cache_ttl else None
+        self.json_encoder = json_encoder
+        self.backend = backend
+        self._validators = _ResponseCache(float("inf"), cache_max_entries) if conditional_get else None
         for key, val in kwargs.items():
             setattr(self, key, val)
+        self._compulsory = tuple(getattr(self, "compulsory_params", None) or ())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _create_session(self):
+        """Create a session that keeps connections to the server alive
+        between calls and retries idempotent calls on gateway errors."""
+        if self.backend == "httpx":
+            return _HTTPXSession()
+        # the session asks for gzip/deflate compressed responses, and for
+        # brotli as well when it is installed (py-seed[speedups])
+        session = requests.Session()
+        # calls other than POST and PATCH are retried when SEED is busy, after any Retry-After
+        retry = Retry(
+            total=_RETRY_TOTAL,
+            backoff_factor=_RETRY_BACKOFF,
+            status_forcelist=_RETRY_STATUSES,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=retry)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    @property
+    def session(self):
+        """Session shared by all calls made by this client."""
+        if self._session is None:
+            # calls may be made from several threads at once
+            with _SESSION_LOCK:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+
+    def close(self):
+        """Close the underlying session and release pooled connections."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def clear_cache(self):
+        """Remove all cached GET responses."""
+        if self._cache is not None:
+            self._cache.clear()
+
+    @staticmethod
+    def _cache_key(url, payload):
+        """Key identifying a GET call, None if it can not be cached."""
+        try:
+            key = (
+                url,
+                frozenset((payload.get("params") or {}).items()),
+                frozenset((payload.get("headers") or {}).items()),
+            )
+            hash(key)
+        except TypeError:
+            # unhashable params, e.g., lists
+            return None
+        return key
 
     def _construct_payload(self, params):
         """Construct parameters for an api call.
@@ -74,14 +336,15 @@ class BaseAPI:
                 :return: A dictionary of k-v pairs to send to the server
                     in the request.
         """
-        compulsory = getattr(self, "compulsory_params", [])
-        for param in compulsory:
+        # copy so the caller's dict is never modified
+        params = dict(params)
+        for param in self._compulsory:
             if param not in params:
-                try:
-                    params[param] = getattr(self, param)
-                except AttributeError:
+                val = getattr(self, param, _MISSING)
+                if val is _MISSING:
                     msg = f"{param} is a compulsory field"
                     raise APIClientError(msg)
+                params[param] = val
         return params
 
     def _construct_url(self, urlstring, use_ssl=None):
@@ -101,51 +364,108 @@ class BaseAPI:
             # raise an error if http is used in url with use_ssl
             raise APIClientError("use_ssl is true but url does not starts with https")
         else:
-            # strip http(s):// off url
-            regex = re.compile("^https?://")
-            urlstring = regex.sub("", urlstring)
-            start = "https://" if use_ssl else "http://"
-            url = f"{start}{urlstring}"
+            url = _normalize_url(urlstring, use_ssl)
         return url
 
-    def check_call_success(self, response):
-        """Return true if api call was successful."""
-        # pylint: disable=no-self-use, no-member
-        return response.status_code == requests.codes.ok
+    @staticmethod
+    def check_call_success(response):
+        """Return true if api call was successful (any 2xx status code)."""
+        return 200 <= response.status_code < 300
+
+    def _set_json_body(self, payload, body, compress=False):
+        """Add the json body to the payload. Bodies that are already
+        serialized (bytes), or are serialized with self.json_encoder, are
+        sent as data so requests does not encode them again. With compress
+        the serialized body is sent gzipped."""
+        if payload.get("files") or (self.json_encoder is None and not isinstance(body, bytes) and not compress):
+            # multipart requests ignore the json body
+            payload["json"] = body
+            return
+        headers = {**(payload["headers"] or {}), "Content-Type": "application/json"}
+        if not isinstance(body, bytes):
+            body = self.json_encoder(body) if self.json_encoder else json.dumps(body)
+        if compress:
+            if isinstance(body, str):
+                body = body.encode()
+            # favor speed over size, numeric json compresses well either way
+            body = gzip.compress(body, compresslevel=1)
+            headers["Content-Encoding"] = "gzip"
+        payload["data"] = body
+        payload["headers"] = headers
 
     def _get(self, url=None, use_ssl=None, **kwargs):
         """Internal method to make api calls using GET."""
         url = self._construct_url(url, use_ssl=use_ssl)
         params = self._construct_payload(kwargs)
-        payload = {"timeout": self.timeout, "headers": params.pop("headers", None)}
+        headers = params.pop("headers", None)
+        payload = {"timeout": self.timeout, "headers": headers}
         if params:
             payload["params"] = params
         if self.auth:  # pragma: no cover
             payload["auth"] = self.auth
+        use_cache = self._cache is not None or self._validators is not None
+        cache_key = self._cache_key(url, payload) if use_cache else None
+        if cache_key is not None and self._cache is not None:
+            api_call = self._cache.get(cache_key)
+            if api_call is not None:
+                return api_call
+        validated = None
+        if cache_key is not None and self._validators is not None:
+            validated = self._validators.get(cache_key)
+            if validated is not None:
+                payload["headers"] = {**(headers or {}), **self._conditional_headers(validated)}
         # timeout is specified in the payload
-        api_call = requests.get(url, **payload)  # noqa: S113
+        api_call = self.session.get(url, **payload)
+        if validated is not None and api_call.status_code == _HTTP_NOT_MODIFIED:
+            # the body has not changed, so reuse the previous response
+            api_call = validated
+        if cache_key is not None and api_call.status_code == _HTTP_OK:
+            if self._cache is not None:
+                self._cache.set(cache_key, api_call)
+            if self._validators is not None and self._conditional_headers(api_call):
+                self._validators.set(cache_key, api_call)
         return api_call
 
-    def _post(self, url=None, use_ssl=None, params=None, files=None, **kwargs):
-        """Internal method to make api calls using POST."""
+    @staticmethod
+    def _conditional_headers(response):
+        """Headers to revalidate a previous response with."""
+        headers = {}
+        if response.headers.get("ETag"):
+            headers["If-None-Match"] = response.headers["ETag"]
+        if response.headers.get("Last-Modified"):
+            headers["If-Modified-Since"] = response.headers["Last-Modified"]
+        return headers
+
+    def _send(self, verb, url=None, use_ssl=None, params=None, files=None, *, stream=False, compress=False, **kwargs):
+        """Internal method to make api calls that send a body, i.e.,
+        POST, PUT and PATCH. With stream the response body is only
+        downloaded as it is read, e.g., for large files. With compress
+        json bodies are sent gzipped, which the server must support."""
+        # pylint: disable=too-many-arguments
         url = self._construct_url(url, use_ssl=use_ssl)
         if not params:
             params = {}
         params = self._construct_payload(params)
-        payload = {"timeout": self.timeout, "headers": params.pop("headers", None)}
+        headers = params.pop("headers", None)
+        payload = {"timeout": self.timeout, "headers": headers}
         if params:
             payload["params"] = params
         if files:
             payload["files"] = files
+        if stream:
+            payload["stream"] = True
         if self.auth:  # pragma: no cover
             payload["auth"] = self.auth
         if self.use_json:
             data = kwargs.pop("json", None)
             if data:
-                payload["json"] = data
+                self._set_json_body(payload, data, compress)
+            elif hasattr(kwargs.get("data"), "read"):
+                # streamed bodies, e.g., a multipart encoder, are sent as is
+                payload["data"] = kwargs.pop("data")
             else:
                 # just put the remaining kwargs into the json field
-                payload["json"] = kwargs
+                self._set_json_body(payload, kwargs, compress)
         else:
             data = kwargs.pop("data", None)
             if data:
@@ -154,101 +474,62 @@ class BaseAPI:
                 # just put the remaining kwargs into the data field
                 payload["data"] = kwargs
 
-        # if there are any remaining kwargs, then put them into the params
-        if "params" not in payload:
-            payload["params"] = {}
-        payload["params"].update(**kwargs)
+        # if there are any remaining kwargs, then put them into the params,
+        # SEED reads organization_id etc. from the query string
+        payload.setdefault("params", {}).update(kwargs)
+
+        # writes may change what a cached GET would return
+        self.clear_cache()
 
-        # now do the actual call to post!
+        # now do the actual call, e.g., self.session.post
         # timeout is specified in the payload
-        api_call = requests.post(url, **payload)  # noqa: S113
-        return api_call
+        return getattr(self.session, verb)(url, **payload)
+
+    def _post(self, url=None, use_ssl=None, params=None, files=None, **kwargs):
+        """Internal method to make api calls using POST."""
+        return self._send("post", url=url, use_ssl=use_ssl, params=params, files=files, **kwargs)
 
     def _put(self, url=None, use_ssl=None, params=None, files=None, **kwargs):
         """Internal method to make api calls using PUT."""
-        url = self._construct_url(url, use_ssl=use_ssl)
-        if not params:
-            params = {}
-        params = self._construct_payload(params)
-        payload = {"timeout": self.timeout, "headers": params.pop("headers", None)}
-        if params:
-            payload["params"] = params
-        if files:  # pragma: no cover
-            payload["files"] = files
-        if self.auth:  # pragma: no cover
-            payload["auth"] = self.auth
-        if self.use_json:
-            data = kwargs.pop("json", None)
-            if data:
-                payload["json"] = data
-            else:
-                # just put the remaining kwargs into the json field
-                payload["json"] = kwargs
-        else:
-            data = kwargs.pop("data", None)
-            if data:
-                payload["data"] = data
-            else:
-                # just put the remaining kwargs into the data field
-                payload["data"] = kwargs
-
-        # if there are any remaining kwargs, then put them into the params
-        if "params" not in payload:
-            payload["params"] = {}
-        payload["params"].update(**kwargs)
-        # timeout is specified in the payload
-        api_call = requests.put(url, **payload)  # noqa: S113
-        return api_call
+        return self._send("put", url=url, use_ssl=use_ssl, params=params, files=files, **kwargs)
 
     def _patch(self, url=None, use_ssl=None, params=None, files=None, **kwargs):
         """Internal method to make api calls using PATCH."""
-        url = self._construct_url(url, use_ssl=use_ssl)
-        if not params:
-            params = {}
-        params = self._construct_payload(params)
-        payload = {"timeout": self.timeout, "headers": params.pop("headers", None)}
-        if params:
-            payload["params"] = params
-        if files:
-            payload["files"] = files
-        if self.auth:  # pragma: no cover
-            payload["auth"] = self.auth
-        if self.use_json:
-            data = kwargs.pop("json", None)
-            if data:
-                payload["json"] = data
-            else:
-                # just put the remaining kwargs into the json field
-                payload["json"] = kwargs
-        else:
-            data = kwargs.pop("data", None)
-            if data:
-                payload["data"] = data
-            else:
-                # just put the remaining kwargs into the data field
-                payload["data"] = kwargs
-
-        # if there are any remaining kwargs, then put them into the params
-        if "params" not in payload:
-            payload["params"] = {}
-        payload["params"].update(**kwargs)
-        # timeout is specified in the payload
-        api_call = requests.patch(url, **payload)  # noqa: S113
-        return api_call
+        return self._send("patch", url=url, use_ssl=use_ssl, params=params, files=files, **kwargs)
 
     def _delete(self, url=None, use_ssl=None, **kwargs):
         """Internal method to make api calls using DELETE."""
         url = self._construct_url(url, use_ssl=use_ssl)
         params = self._construct_payload(kwargs)
-        payload = {"timeout": self.timeout, "headers": params.pop("headers", None)}
+        headers = params.pop("headers", None)
+        payload = {"timeout": self.timeout, "headers": headers}
         if params:
             payload["params"] = params
         if self.auth:  # pragma: no cover
             payload["auth"] = self.auth
+        # writes may change what a cached GET would return
+        self.clear_cache()
         # timeout is specified in the payload
-        api_call = requests.delete(url, **payload)  # noqa: S113
+        api_call = self.session.delete(url, **payload)
         return api_call
 
+    def _bulk_post(self, url=None, use_ssl=None, params=None, records=None, chunk_size=500, **kwargs):
+        """Internal method to POST records to endpoints that accept json arrays,
+        e.g., SEED meter readings, as bodies of at most chunk_size records each.
+
+        :returns: iterator of responses, one per chunk. Each chunk is only sent
+            once the response of the previous one has been taken, so the caller
+            can stop at the first failed chunk.
+        """
+        # pylint: disable=too-many-arguments
+        if not self.use_json:
+            raise APIClientError("Records can only be sent in bulk as json arrays, use_json must be set")
+        records = list(records or [])
+        return (
+            self._post(url=url, use_ssl=use_ssl, params=dict(params or {}), json=records[start : start + chunk_size], **kwargs)
+            for start in range(0, len(records), chunk_size)
+        )
+
 
 class JSONAPI(BaseAPI):
     """
@@ -276,11 +557,8 @@ class UserAuthMixin:
         # as used by SEED (if supplied as api_key not password)
         if not password:
             password = getattr(self, "api_key", None)
-        if getattr(self, "auth_method", None) == "digest":
-            auth = requests.auth.HTTPDigestAuth(username, password)
-        else:
-            auth = requests.auth.HTTPBasicAuth(username, password)
-        return auth
+        auth_class = HTTPDigestAuth if getattr(self, "auth_method", None) == "digest" else HTTPBasicAuth
+        return auth_class(username, password)
 
     def _construct_payload(self, params):
         """Construct parameters for an api call.
@@ -307,14 +585,23 @@ class OAuthMixin:
     oauth_client = None
 
     def _get_access_token(self):
-        """Generate OAuth access token"""
-        private_key_file = getattr(self, "private_key_location", None)
-        client_id = getattr(self, "client_id", None)
-        username = getattr(self, "username", None)
-        with open(private_key_file) as pk_file:
-            sig = pk_file.read()
-            oauth_client = self.oauth_client(sig, username, client_id, pvt_key_password=getattr(self, "pvt_key_password", None))
-            return oauth_client.get_access_token()
+        """Generate OAuth access token, the token is reused until it is
+        about to expire."""
+        token = getattr(self, "_access_token", None)
+        if token and time.time() < self._access_token_expiry - _TOKEN_EXPIRY_MARGIN:
+            return token
+        if getattr(self, "_oauth_client", None) is None:
+            # only read the private key and set up the client once
+            private_key_file = getattr(self, "private_key_location", None)
+            client_id = getattr(self, "client_id", None)
+            username = getattr(self, "username", None)
+            with open(private_key_file) as pk_file:
+                sig = pk_file.read()
+            self._oauth_client = self.oauth_client(sig, username, client_id, pvt_key_password=getattr(self, "pvt_key_password", None))
+        token = self._oauth_client.get_access_token()
+        self._access_token = token
+        self._access_token_expiry = _get_token_expiry(token)
+        return token
 
     def _construct_payload(self, params):
         """Construct parameters for an api call.
@@ -326,5 +613,5 @@ class OAuthMixin:
         """
         params = super()._construct_payload(params)
         token = getattr(self, "token", None) or self._get_access_token()
-        params["headers"] = {"Authorization": f"{self._token_type} {token}"}
+        params["headers"] = {**(params.get("headers") or {}), "Authorization": f"{self._token_type} {token}"}
         return params
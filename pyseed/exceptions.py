@@ -27,26 +27,27 @@ class APIClientError(Exception):
         self.caller = caller
         self.verb = verb
         self.status_code = status_code
-        args = (error, service, url, caller, verb.upper() if verb else None, status_code)
+        self._verb_upper = verb.upper() if verb else None
+        args = (error, service, url, caller, self._verb_upper, status_code)
         self.kwargs = kwargs
         super().__init__(*args)
 
     def __str__(self):
-        msg = f"{self.__class__.__name__}: {self.error}"
+        parts = [f"{self.__class__.__name__}: {self.error}"]
         if self.service:
-            msg = f"{msg}, calling service {self.service}"
+            parts.append(f", calling service {self.service}")
         if self.caller:
-            msg = f"{msg} as {self.caller}"
+            parts.append(f" as {self.caller}")
         if self.url:
-            msg = f"{msg} with url {self.url}"
+            parts.append(f" with url {self.url}")
         if self.verb:
-            msg = f"{msg}, http method: {self.verb.upper()}"
+            parts.append(f", http method: {self._verb_upper}")
         if self.kwargs:
-            arguments = ", ".join([f"{key!s}={val!s}" for key, val in self.kwargs.items()])
-            msg = f"{msg} supplied with {arguments}"
+            arguments = ", ".join(f"{key!s}={val!s}" for key, val in self.kwargs.items())
+            parts.append(f" supplied with {arguments}")
         if self.status_code:
-            msg = f"{msg} http status code: {self.status_code}"
-        return msg
+            parts.append(f" http status code: {self.status_code}")
+        return "".join(parts)
 
 
 class SEEDError(APIClientError):
@@ -3,23 +3,193 @@ SEED Platform (TM), Copyright (c) Alliance for Sustainable Energy, LLC, and othe
 See also https://github.com/seed-platform/py-seed/main/LICENSE
 """
 
+import asyncio
+import copy
+import csv
+import hashlib
 import json
 import logging
 import os
+import sys
+import threading
 import time
-from collections import Counter
-from csv import DictReader
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from datetime import date
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
 from typing import Any, Optional, Union
 
-from openpyxl import Workbook
+import requests
 
-from pyseed.seed_client_base import SEEDReadWriteClient
+from pyseed.exceptions import SEEDError
+from pyseed.seed_client_base import _XLSX_CONTENT_TYPE, SEEDReadWriteClient, _replace_url_args
 from pyseed.utils import read_map_file
 
+try:
+    from requests_toolbelt import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
+
+# orjson.loads and json.loads have different signatures
+json_loads: Callable[..., Any]
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 logger = logging.getLogger(__name__)
 
+# the columns of an extra data columns file, in the order of the arguments of create_extra_data_column
+_EXTRA_DATA_COLUMN_FIELDS = ("column_name", "display_name", "inventory_type", "column_description", "data_type")
+
+# the inventory types and data types that SEED accepts for extra data columns, others are
+# still sent as newer versions of SEED may accept them
+_EXTRA_DATA_COLUMN_INVENTORY_TYPES = frozenset({"Property", "Taxlot", "TaxLot"})
+_EXTRA_DATA_COLUMN_DATA_TYPES = frozenset(
+    {
+        "None",
+        "number",
+        "float",
+        "integer",
+        "string",
+        "geometry",
+        "datetime",
+        "date",
+        "boolean",
+        "area",
+        "eui",
+        "ghg_intensity",
+        "ghg",
+        "wui",
+        "water_use",
+    },
+)
+
+# size of the chunks that downloaded files are written in
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# the label colors that SEED accepts
+_LABEL_COLORS = frozenset({"red", "blue", "light blue", "green", "white", "orange", "gray"})
+
+
+def _check_label_color(color: str) -> None:
+    """Raise a ValueError for label colors that SEED would reject"""
+    if color not in _LABEL_COLORS:
+        raise ValueError(f"Label color must be one of {', '.join(sorted(_LABEL_COLORS))}, not '{color}'")
+
+
+@lru_cache(maxsize=32)
+def _read_map_file_cached(mapping_file: str, mtime_ns: int, size: int) -> list:  # noqa: ARG001
+    """Read a mapping file, the parsed mappings are reused until the
+    modification time or size of the file changes"""
+    return read_map_file(mapping_file)
+
+
+@lru_cache(maxsize=8)
+def _read_connection_config_cached(filepath: str, mtime_ns: int, size: int) -> dict:  # noqa: ARG001
+    """Parse a connection config file, the params are reused until the
+    modification time or size of the file changes"""
+    # read the whole (small) file at once and parse from bytes, with
+    # orjson if it is installed (py-seed[speedups])
+    return json_loads(Path(filepath).read_bytes())
+
+
+def _read_extra_data_columns_file(filepath: str) -> list:
+    """Read the rows of an extra data columns file as the args of create_extra_data_column.
+    The whole file is checked before any column is created, so a bad row cannot leave the
+    columns half created. Unknown inventory and data types are only warned about."""
+    rows = []
+    with open(filepath, newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        missing = [field for field in _EXTRA_DATA_COLUMN_FIELDS if field not in header]
+        if missing:
+            raise ValueError(f"Columns file {filepath} is missing the headers: {', '.join(missing)}")
+        fields = [header.index(field) for field in _EXTRA_DATA_COLUMN_FIELDS]
+        inventory_type_field, data_type_field = fields[2], fields[4]
+        for row in reader:
+            if not row:
+                # csv.reader returns an empty row for a blank line
+                continue
+            if len(row) < len(header):
+                raise ValueError(f"Line {reader.line_num} of {filepath} has {len(row)} values, expected {len(header)}")
+            if row[inventory_type_field] not in _EXTRA_DATA_COLUMN_INVENTORY_TYPES:
+                logger.warning(f"Line {reader.line_num} of {filepath} has an unknown inventory_type '{row[inventory_type_field]}'")
+            if row[data_type_field] not in _EXTRA_DATA_COLUMN_DATA_TYPES:
+                logger.warning(f"Line {reader.line_num} of {filepath} has an unknown data_type '{row[data_type_field]}'")
+            rows.append([row[field] for field in fields])
+    return rows
+
+
+def _transient_errors() -> tuple:
+    """Errors of calls that may succeed when retried: SEED could not be reached, or failed
+    on its side, see _is_transient_error"""
+    errors = (SEEDError, requests.ConnectionError, requests.Timeout)
+    # the httpx backend raises its own errors, httpx is only imported when that backend is used
+    httpx = sys.modules.get("httpx")
+    return errors if httpx is None else (*errors, httpx.TransportError)
+
+
+def _is_transient_error(err: Exception) -> bool:
+    """Only server errors and throttling of the SEED errors are worth retrying, the other
+    statuses, e.g., 404 for an unknown progress key or 401 for bad credentials, will not change"""
+    if isinstance(err, SEEDError):
+        return err.status_code is not None and (err.status_code == 429 or err.status_code >= 500)
+    return True
+
+
+def _file_sha256(filepath: str) -> str:
+    """Hash the contents of a file in chunks, without reading the whole file into memory"""
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as f:
+        for chunk in iter(lambda: f.read(_DOWNLOAD_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _index_by_name(items: list) -> dict:
+    """Build a {name: item} lookup, SEED does not always enforce unique names
+    so keep the first item with each name"""
+    by_name: dict[str, Any] = {}
+    for item in items:
+        by_name.setdefault(item["name"], item)
+    return by_name
+
+
+class _RewindableMultipartEncoder:
+    """Multipart form data body of an open file, streamed by a MultipartEncoder, that can be
+    rewound to its start. A MultipartEncoder can only be read once, so without seek a call
+    retried by the session, e.g., on a 503 from SEED, would resend an empty body."""
+
+    def __init__(self, filename: str, f) -> None:
+        self._fields = {"file": (filename, f, "application/octet-stream")}
+        self._file = f
+        self._start = f.tell()
+        self._encoder = MultipartEncoder(fields=self._fields)
+        # the Content-Type header names the boundary, rewinding keeps it
+        self.content_type = self._encoder.content_type
+        self.len = self._encoder.len
+        self._position = 0
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._encoder.read(size)
+        self._position += len(chunk)
+        return chunk
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if offset != 0 or whence != os.SEEK_SET:
+            raise OSError("A multipart body can only be rewound to its start")
+        self._file.seek(self._start)
+        self._encoder = MultipartEncoder(fields=self._fields, boundary=self._encoder.boundary_value)
+        self._position = 0
+        return 0
+
 
 class SeedClientWrapper:
     """This is a wrapper around the SEEDReadWriteClient. If you need access
@@ -30,6 +200,7 @@ class SeedClientWrapper:
         organization_id: int,
         connection_params: Optional[dict] = None,
         connection_config_filepath: Optional[Path] = None,
+        session: Optional[requests.Session] = None,
     ) -> None:
         """wrapper around SEEDReadWriteClient.
 
@@ -44,7 +215,11 @@ class SeedClientWrapper:
                     "port": 8000,
                     "use_ssl": false
                 }
+                Optionally "backend": "httpx" makes the calls over a single pooled HTTP/2 connection,
+                which requires py-seed[http2].
             connection_config_filepath (Path, optional): path to the parameters (JSON file). Defaults to None.
+            session (requests.Session, optional): session to share between clients. Defaults to None, in which
+                case the client creates a pooled session that keeps connections to SEED alive between calls.
 
         Raises:
             Exception: SeedClientWrapper
@@ -61,7 +236,17 @@ class SeedClientWrapper:
             self.payload = SeedClientWrapper.read_connection_config_file(connection_config_filepath)
             # read in from config file
 
-        self.client = SEEDReadWriteClient(organization_id, **self.payload)
+        self.client = SEEDReadWriteClient(organization_id, session=session, **self.payload)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self) -> None:
+        """Close the client session and release the pooled connections"""
+        self.client.close()
 
     @classmethod
     def read_connection_config_file(cls, filepath: Path) -> dict:
@@ -82,28 +267,45 @@ class SeedClientWrapper:
             }
 
         Args:
-            filepath (str): path to the connection config file
+            filepath (Path): path to the connection config file
         """
+        filepath = Path(filepath)
         if not filepath.exists():
             raise Exception(f"Cannot find connection config file: {filepath!s}")
 
-        connection_params = None
-        with open(filepath) as f:
-            connection_params = json.load(f)
-        return connection_params
+        stat = filepath.stat()
+        # a copy, so that changes to the params do not leak into the cached ones
+        return dict(_read_connection_config_cached(str(filepath.resolve()), stat.st_mtime_ns, stat.st_size))
 
 
 class SeedClient(SeedClientWrapper):
     """SEED Client with several property related
     helper methods implemented."""
 
+    # seconds to reuse lists that rarely change, e.g., labels, cycles and organizations
+    CACHE_TTL = 30
+
+    # where upload_and_match_datafile keeps the results of ingested files, see use_ingest_cache,
+    # ~/.seed_client_cache if not set
+    INGEST_CACHE_DIR: Optional[Path] = None
+
     def __init__(
         self,
         organization_id: int,
         connection_params: Optional[dict] = None,
         connection_config_filepath: Optional[Path] = None,
+        session: Optional[requests.Session] = None,
     ) -> None:
-        super().__init__(organization_id, connection_params, connection_config_filepath)
+        super().__init__(organization_id, connection_params, connection_config_filepath, session)
+        # {(org_id, name, *args): (time fetched, result)}, see _cached
+        self._ttl_cache: dict[tuple, tuple[float, Any]] = {}
+        # {name: times the results stored under name were invalidated or updated}, see _cached
+        self._cache_generations: dict[str, int] = {}
+        self._cache_lock = threading.Lock()
+        # {(endpoint, org_id): url}
+        self._org_urls: dict[tuple[str, int], str] = {}
+        # {(org_id, label name): task}, see get_or_create_label_async
+        self._label_tasks: dict[tuple[int, str], asyncio.Task] = {}
 
         # set org if you can
         if self.payload and self.payload.get("seed_org_name", None):
@@ -125,28 +327,25 @@ class SeedClient(SeedClientWrapper):
                     org data
                 }
         """
-        orgs = self.get_organizations()
-        for org in orgs:
-            if org["name"] == org_name:
-                if set_org_id:
-                    self.client.org_id = org["id"]
-                return org
+        org = self._cached("organizations", self._list_organizations, True)[1].get(org_name)
+        if org is None:
+            raise ValueError(f"Organization '{org_name}' not found")
 
-        raise ValueError(f"Organization '{org_name}' not found")
+        if set_org_id:
+            self.client.org_id = org["id"]
+        return org
 
     def instance_information(self) -> dict:
-        """Return the instance information.
+        """Return the instance information. The version of SEED is reused for CACHE_TTL seconds.
 
         Returns:
             dict: instance information
         """
         # http://localhost:8000/api/version/
+        version = self._cached("version", lambda: self.client.get(None, required_pk=False, endpoint="version", data_name="all"))
         # add in URL to the SEED instance
         # add in username (but not the password/api key)
-        info = self.client.get(None, required_pk=False, endpoint="version", data_name="all")
-        info["host"] = self.client.base_url
-        info["username"] = self.client.username
-        return info
+        return {**version, "host": self.client.base_url, "username": self.client.username}
 
     def get_users(self) -> dict:
         """Get a list of users visible to the current user
@@ -160,13 +359,13 @@ class SeedClient(SeedClientWrapper):
         users = self.client.list(endpoint="users")
         return users
 
-    def get_organizations(self, brief: bool = True) -> dict:
+    def get_organizations(self, brief: bool = True) -> list:
         """Get a list organizations (that one is allowed to view)
 
         Args:
             brief (bool, optional): if True, then only return the organization id with some other basic info. Defaults to True.
         Returns:
-            dict: [
+            list: [
                 {
                     "name": "test-org",
                     "org_id": 1,
@@ -179,12 +378,15 @@ class SeedClient(SeedClientWrapper):
                 ...
             ]
         """
+        return self._cached("organizations", self._list_organizations, brief)[0]
+
+    def _list_organizations(self, brief: bool) -> tuple[list, dict]:
         orgs = self.client.list(
             endpoint="organizations",
             data_name="organizations",
             brief="true" if brief else "false",
         )
-        return orgs
+        return orgs, _index_by_name(orgs)
 
     def get_user_id(self, username: str) -> Union[None, int]:
         """Get the user ID for the given username
@@ -195,9 +397,10 @@ class SeedClient(SeedClientWrapper):
         Returns:
             int: user ID
         """
+        # compare string case insensitive
+        username = username.casefold()
         for user in self.get_users()["users"]:
-            # compare string case insensitive
-            if user["email"].lower() == username.lower():
+            if user["email"].casefold() == username:
                 return user["user_id"]
 
         return None
@@ -233,10 +436,9 @@ class SeedClient(SeedClientWrapper):
                 }
         """
         # see if the organization already exists
-        orgs = self.get_organizations()
-        for org in orgs:
-            if org["name"].lower() == org_name.lower():
-                raise Exception(f"Organization '{org_name}' already exists")
+        folded_name = org_name.casefold()
+        if any(org["name"].casefold() == folded_name for org in self.get_organizations()):
+            raise Exception(f"Organization '{org_name}' already exists")
 
         user_id = self.get_user_id(self.client.username)
 
@@ -245,25 +447,66 @@ class SeedClient(SeedClientWrapper):
             "organization_name": org_name,
         }
         org = self.client.post(endpoint="organizations", json=payload)
+        self._invalidate_cache("organizations")
         return org
 
-    def get_buildings(self) -> list[dict]:
-        total_qry = self.client.list(endpoint="properties", data_name="pagination", per_page=100)
-
-        # step through each page of the results
-        buildings: list[dict] = []
-        for i in range(1, total_qry["num_pages"] + 1):
-            buildings = buildings + self.client.list(
-                endpoint="properties",
-                data_name="results",
-                per_page=100,
-                page=i,
-                cycle=self.cycle_id,
-            )
-        # print(f"number of buildings retrieved: {len(buildings)}")
+    def get_buildings(self, per_page: int = 100, max_workers: int = 8) -> list[dict]:
+        """Get all the buildings (properties) in the cycle_id that is defined in the constructor.
+        The first page tells how many pages there are, the rest of the pages are then fetched
+        concurrently.
+
+        Args:
+            per_page (int, optional): number of buildings to request per page. Defaults to 100.
+            max_workers (int, optional): maximum number of pages to request at once. Defaults to 8.
+
+        Returns:
+            list[dict]: the buildings, in page order
+        """
+        first_page = self._list_page(1, per_page)
+        buildings: list[dict] = first_page["results"]
+        num_pages = first_page["pagination"]["num_pages"]
+        if num_pages > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for page in executor.map(self._list_page, range(2, num_pages + 1), repeat(per_page)):
+                    buildings.extend(page["results"])
+
+        return buildings
+
+    async def get_buildings_async(self, per_page: int = 100, concurrency: int = 8) -> list[dict]:
+        """Awaitable version of get_buildings. With the client created with backend="httpx"
+        the concurrent page requests are multiplexed over a single HTTP/2 connection.
+
+        Args:
+            per_page (int, optional): number of buildings to request per page. Defaults to 100.
+            concurrency (int, optional): maximum number of pages to request at once. Defaults to 8.
+
+        Returns:
+            list[dict]: the buildings, in page order
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def get_page(page: int) -> dict:
+            async with semaphore:
+                return await asyncio.to_thread(self._list_page, page, per_page)
+
+        first_page = await get_page(1)
+        buildings: list[dict] = first_page["results"]
+        pages = await asyncio.gather(*(get_page(page) for page in range(2, first_page["pagination"]["num_pages"] + 1)))
+        for page in pages:
+            buildings.extend(page["results"])
 
         return buildings
 
+    def _list_page(self, page: int, per_page: int) -> dict:
+        """Get one page of the buildings in the cycle, with the pagination"""
+        return self.client.list(
+            endpoint="properties",
+            data_name="all",
+            per_page=per_page,
+            page=page,
+            cycle=self.cycle_id,
+        )
+
     def get_property_view(self, property_view_id: int) -> dict:
         """Return a single property (view and state) by the property view id. It is
         recommended to use the more verbose version of `get_property` below.
@@ -347,9 +590,10 @@ class SeedClient(SeedClientWrapper):
                 }, ...
             ]
         """
-        labels = self.client.list(endpoint="labels")
+        labels = self._labels_cached()
         if filter_by_name is not None:
-            labels = [label for label in labels if label["name"] in filter_by_name]
+            names = frozenset(filter_by_name)
+            labels = [label for label in labels if label["name"] in names]
         return labels
 
     def get_or_create_label(self, label_name: str, color: str = "blue", show_in_list: bool = False) -> dict:
@@ -370,12 +614,106 @@ class SeedClient(SeedClientWrapper):
             }
         """
         # First check if the label exists
-        label = self.get_labels(filter_by_name=[label_name])
-        if len(label) == 1:
-            return label[0]
+        label = self._label_by_name(label_name)
+        if label is not None:
+            return label
 
+        _check_label_color(color)
         payload = {"name": label_name, "color": color, "show_in_list": show_in_list}
-        return self.client.post(endpoint="labels", json=payload)
+        try:
+            label = self.client.post(endpoint="labels", json=payload)
+        except SEEDError:
+            # SEED enforces unique label names, so the label may have been
+            # created since the labels were cached, e.g., by another client
+            self.invalidate_labels_cache()
+            label = self._label_by_name(label_name)
+            if label is not None:
+                return label
+            raise
+        # the cached labels do not have the new label
+        self.invalidate_labels_cache()
+        return label
+
+    async def get_or_create_label_async(self, label_name: str, color: str = "blue", show_in_list: bool = False) -> dict:
+        """Awaitable version of get_or_create_label. Concurrent calls for the same label
+        share a single lookup (and POST), rather than each creating the label.
+
+        Args:
+            label_name (str): Name of label, see get_or_create_label.
+            color (str, optional): Default color of the label. 'blue' is the default.
+            show_in_list (bool, optional): Show the label in the inventory list page. Defaults to False.
+
+        Returns:
+            dict: the label, see get_or_create_label
+        """
+        key = (self.client.org_id, label_name)
+        task = self._label_tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(asyncio.to_thread(self.get_or_create_label, label_name, color, show_in_list))
+            self._label_tasks[key] = task
+            task.add_done_callback(lambda _: self._label_tasks.pop(key, None))
+        # shield, so that a cancelled caller does not cancel the others
+        return await asyncio.shield(task)
+
+    def invalidate_labels_cache(self) -> None:
+        """Forget the cached labels so that the next lookup fetches them from SEED"""
+        self._invalidate_cache("labels")
+        # renamed or deleted labels change which views match a label name
+        self._invalidate_cache("view_ids_with_label")
+
+    def _labels_cached(self) -> list:
+        """Get the labels of the organization, reusing the previous response for a while"""
+        return self._get_labels_cache()[0]
+
+    def _label_by_name(self, label_name: str) -> Optional[dict]:
+        """Get the label of the organization with the name, None if there is no such label"""
+        return self._get_labels_cache()[1].get(label_name)
+
+    def _get_labels_cache(self) -> tuple[list, dict]:
+        def fetch():
+            labels = self.client.list(endpoint="labels")
+            # SEED enforces unique label names within an organization
+            return labels, {label["name"]: label for label in labels}
+
+        return self._cached("labels", fetch)
+
+    def _cached(self, name: str, fetch, *args):
+        """Get the result of fetch(*args), reusing it for CACHE_TTL seconds. Results
+        are kept per organization, name and args. A copy is returned, so that callers
+        cannot change the cached result."""
+        key = (self.client.org_id, name, *args)
+        with self._cache_lock:
+            entry = self._ttl_cache.get(key)
+            generation = self._cache_generations.get(name, 0)
+        if entry is not None and time.monotonic() - entry[0] < self.CACHE_TTL:
+            return copy.deepcopy(entry[1])
+        # fetch without holding the lock, so that other lookups are not held up
+        value = fetch(*args)
+        with self._cache_lock:
+            # a result fetched before an invalidation or update may be out of date
+            if self._cache_generations.get(name, 0) == generation:
+                self._ttl_cache[key] = (time.monotonic(), value)
+        return copy.deepcopy(value)
+
+    def _update_cached(self, name: str, update: Callable[[Any], Any], *args) -> None:
+        """Replace the cached result of name and args, if there is one, with a copy of
+        update(result), so that the values put in by update stay with the caller"""
+        key = (self.client.org_id, name, *args)
+        with self._cache_lock:
+            self._cache_generations[name] = self._cache_generations.get(name, 0) + 1
+            entry = self._ttl_cache.get(key)
+            if entry is not None:
+                self._ttl_cache[key] = (entry[0], copy.deepcopy(update(entry[1])))
+
+    def _invalidate_cache(self, name: str, *args) -> None:
+        """Forget the cached results stored under name, or only the one of args if given"""
+        with self._cache_lock:
+            self._cache_generations[name] = self._cache_generations.get(name, 0) + 1
+            if args:
+                self._ttl_cache.pop((self.client.org_id, name, *args), None)
+            else:
+                for key in [key for key in self._ttl_cache if key[1] == name]:
+                    del self._ttl_cache[key]
 
     def update_label(
         self,
@@ -393,6 +731,7 @@ class SeedClient(SeedClientWrapper):
             new_show_in_list (bool, optional): New boolean on whether to show the label in the inventory list page. Defaults to None.
 
         Raises:
+            ValueError: If the new_color is not a valid label color.
             Exception: If the label does not exist, then throw an error.
 
         Returns:
@@ -405,11 +744,16 @@ class SeedClient(SeedClientWrapper):
             }
         """
         # color (str, optional): Default color of the label. Must be from red, blue, light blue, green, white, orange, gray. 'blue' is the default.
+        if new_color is not None:
+            _check_label_color(new_color)
+
         # get the existing label
-        label = self.get_labels(filter_by_name=[label_name])
-        if len(label) != 1:
+        label = self._label_by_name(label_name)
+        if label is None:
             raise Exception(f"Could not find label to update of {label_name}")
-        current_label = label[0]
+        # the label is changed below, so do not keep it cached
+        self.invalidate_labels_cache()
+        current_label = label
 
         if new_label_name is not None:
             current_label["name"] = new_label_name
@@ -434,11 +778,12 @@ class SeedClient(SeedClientWrapper):
         Returns:
             dict: _description_
         """
-        label = self.get_labels(filter_by_name=[label_name])
-        if len(label) != 1:
+        label = self._label_by_name(label_name)
+        if label is None:
             raise Exception(f"Could not find label to delete with name {label_name}")
-        label_id = label[0]["id"]
+        label_id = label["id"]
 
+        self.invalidate_labels_cache()
         return self.client.delete(label_id, endpoint="labels")
 
     def get_view_ids_with_label(self, label_names: Union[str, list] = []) -> list:
@@ -448,6 +793,11 @@ class SeedClient(SeedClientWrapper):
         Note that with labels, the data.selected field is for property view ids! SEED was updated
         in June 2022 to add in the label_names to filter on.
 
+        The result is reused for CACHE_TTL seconds, or until labels are changed or applied, or
+        buildings are created or updated, through this client. Labels applied, or views created,
+        by other users or imports in that time are not seen until the result expires, call
+        invalidate_labels_cache to fetch the latest view IDs.
+
         Args:
             label_names (str, list, optional): list of the labels to filter on. Defaults to [].
 
@@ -458,12 +808,15 @@ class SeedClient(SeedClientWrapper):
         if not isinstance(label_names, list):
             label_names = [label_names]
 
-        properties = self.client.post(
-            endpoint="properties_labels",
-            cycle=self.cycle_id,
-            json={"label_names": label_names},
-        )
-        return properties
+        def fetch(cycle_id, names):
+            return self.client.post(
+                endpoint="properties_labels",
+                cycle=cycle_id,
+                json={"label_names": list(names)},
+            )
+
+        # the order and duplicates of the names do not change the result
+        return self._cached("view_ids_with_label", fetch, self.cycle_id, tuple(sorted(set(label_names))))
 
     def update_labels_of_buildings(
         self,
@@ -493,6 +846,83 @@ class SeedClient(SeedClientWrapper):
                 ]
             }
         """
+        endpoint, add_label_ids, remove_label_ids = self._resolve_label_update(inventory_type, add_label_names, remove_label_names)
+        return self._put_labels(endpoint, building_ids, add_label_ids, remove_label_ids)
+
+    def update_labels_of_buildings_bulk(self, updates: list) -> list:
+        """Apply several label updates with as few requests as possible. Updates that add
+        and remove the same labels are merged into a single request.
+
+        Args:
+            updates (list): list of dicts with the arguments of update_labels_of_buildings, e.g.,
+                [
+                    {
+                        "add_label_names": ["Violation"],
+                        "remove_label_names": ["Complied"],
+                        "building_ids": [1, 2, 3],
+                        "inventory_type": "property",  # optional
+                    },
+                    ...
+                ]
+
+        Returns:
+            list: the result of each merged request, see update_labels_of_buildings
+        """
+        groups: dict[tuple, list] = {}
+        for update in updates:
+            endpoint, add_label_ids, remove_label_ids = self._resolve_label_update(
+                update.get("inventory_type", "property"),
+                update.get("add_label_names", []),
+                update.get("remove_label_names", []),
+            )
+            key = (endpoint, tuple(add_label_ids), tuple(remove_label_ids))
+            groups.setdefault(key, []).extend(update["building_ids"])
+
+        return [
+            self._put_labels(endpoint, building_ids, list(add_label_ids), list(remove_label_ids))
+            for (endpoint, add_label_ids, remove_label_ids), building_ids in groups.items()
+        ]
+
+    async def update_labels_of_buildings_async(
+        self,
+        add_label_names: list,
+        remove_label_names: list,
+        building_ids: list,
+        inventory_type: str = "property",
+        chunk_size: int = 500,
+        concurrency: int = 4,
+    ) -> list:
+        """Add and remove label names of the passed building ids, see update_labels_of_buildings.
+        The building ids are split into chunks which are updated concurrently.
+
+        Args:
+            add_label_names (list): list of label names to add, will be converted to IDs
+            remove_label_names (list): list of label names to remove, will be converted to IDs
+            building_ids (list): list of building IDs (property_view_id) to add/remove labels
+            inventory_type (str, optional): taxlot or property inventory. Defaults to 'property'.
+            chunk_size (int, optional): number of buildings updated per request. Defaults to 500.
+            concurrency (int, optional): maximum number of requests at once. Defaults to 4.
+
+        Returns:
+            list: the result of each chunk, see update_labels_of_buildings
+        """
+        endpoint, add_label_ids, remove_label_ids = await asyncio.to_thread(
+            self._resolve_label_update,
+            inventory_type,
+            add_label_names,
+            remove_label_names,
+        )
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def put_chunk(chunk):
+            async with semaphore:
+                return await asyncio.to_thread(self._put_labels, endpoint, chunk, add_label_ids, remove_label_ids)
+
+        chunks = [building_ids[i : i + chunk_size] for i in range(0, len(building_ids), chunk_size)]
+        return await asyncio.gather(*(put_chunk(chunk) for chunk in chunks))
+
+    def _resolve_label_update(self, inventory_type: str, add_label_names: list, remove_label_names: list) -> tuple[str, list, list]:
+        """Get the endpoint and the label ids to add and remove for a label update"""
         if inventory_type == "property":
             endpoint = "labels_property"
         elif inventory_type == "tax_lot":
@@ -501,32 +931,24 @@ class SeedClient(SeedClientWrapper):
             raise ValueError("inventory_type must be either property or tax_lot")
 
         # first make sure that the labels exist
-        labels = self.client.list(endpoint="labels")
-        # create a label id look up
-        label_id_lookup = {label["name"]: label["id"] for label in labels}
+        labels_by_name = self._get_labels_cache()[1]
+        for label_name in set(add_label_names).union(remove_label_names).difference(labels_by_name):
+            logger.warning(f"label name {label_name} not found in SEED, skipping")
 
         # now find the IDs of the labels that we want to add and remove
-        add_label_ids = []
-        remove_label_ids = []
-        for label_name in add_label_names:
-            if label_name in label_id_lookup:
-                add_label_ids.append(label_id_lookup[label_name])
-            else:
-                logger.warning(f"label name {label_name} not found in SEED, skipping")
+        add_label_ids = [labels_by_name[label_name]["id"] for label_name in add_label_names if label_name in labels_by_name]
+        remove_label_ids = [labels_by_name[label_name]["id"] for label_name in remove_label_names if label_name in labels_by_name]
 
-        for label_name in remove_label_names:
-            if label_name in label_id_lookup:
-                remove_label_ids.append(label_id_lookup[label_name])
-            else:
-                logger.warning(f"label name {label_name} not found in SEED, skipping")
+        return endpoint, add_label_ids, remove_label_ids
 
+    def _put_labels(self, endpoint: str, building_ids: list, add_label_ids: list, remove_label_ids: list) -> dict:
         payload = {
             "inventory_ids": building_ids,
             "add_label_ids": add_label_ids,
             "remove_label_ids": remove_label_ids,
         }
-        result = self.client.put(None, required_pk=False, endpoint=endpoint, json=payload)
-        return result
+        self._invalidate_cache("view_ids_with_label")
+        return self.client.put(None, required_pk=False, endpoint=endpoint, json=payload)
 
     def create_building(self, params: dict) -> list:
         """
@@ -536,15 +958,7 @@ class SeedClient(SeedClientWrapper):
 
         Returns the created property_view id
         """
-        # first try matching on custom_id_1
-        matching_id = params.get("state", {}).get("custom_id_1", None)
-
-        if not matching_id:
-            # then try on pm_property_id
-            matching_id = params.get("state", {}).get("pm_property_id", None)
-
-            if not matching_id:
-                raise Exception("This property does not have a pm_property_id or a custom_id_1 for matching...cannot create.")
+        matching_id = self._building_matching_id(params)
 
         cycle_id = params.get("cycle_id")
         # include appropriate cycle in search (if not using the default cycle set on the class)
@@ -554,14 +968,59 @@ class SeedClient(SeedClientWrapper):
             raise Exception("A property matching the provided matching ID (pm_property_id or custom_id_1) already exists.")
 
         results = self.client.post(endpoint="properties", json=params)
+        # the views with a label may have changed
+        self._invalidate_cache("view_ids_with_label")
         return results
 
+    def create_buildings(self, params_list: list[dict], max_workers: int = 8) -> list:
+        """Create several buildings, see create_building. The matching check and the
+        creation of each building are independent, so the buildings are created concurrently.
+
+        Args:
+            params_list (list[dict]): the params of each building to create
+            max_workers (int, optional): maximum number of buildings to create at once. Defaults to 8.
+
+        Raises:
+            Exception: if a building does not have a matching ID, or if two of the buildings share
+                one. These are checked before any building is created.
+
+        Returns:
+            list: the result of each create_building, in the order of params_list
+        """
+        # the matching check cannot see buildings of this batch, so catch those duplicates here
+        seen = set()
+        for params in params_list:
+            key = (self._building_matching_id(params), params.get("cycle_id"))
+            if key in seen:
+                raise Exception(f"More than one property to create has the matching ID {key[0]}")
+            seen.add(key)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.create_building, params_list))
+
+    @staticmethod
+    def _building_matching_id(params: dict):
+        """Get the ID to match a building on, the custom_id_1 or else the pm_property_id"""
+        # first try matching on custom_id_1
+        matching_id = params.get("state", {}).get("custom_id_1", None)
+
+        if not matching_id:
+            # then try on pm_property_id
+            matching_id = params.get("state", {}).get("pm_property_id", None)
+
+            if not matching_id:
+                raise Exception("This property does not have a pm_property_id or a custom_id_1 for matching...cannot create.")
+
+        return matching_id
+
     def update_building(self, property_view_id, params: dict) -> list:
         """
         Updates a building's property_view
         Expects property_view_id and params to contain a state dictionary
         """
         results = self.client.put(property_view_id, endpoint="properties", json=params)
+        # the views with a label may have changed
+        self._invalidate_cache("view_ids_with_label")
         return results
 
     def get_cycles(self) -> list:
@@ -588,9 +1047,18 @@ class SeedClient(SeedClientWrapper):
                 ...
             ]
         """
-        # first list the cycles
-        cycles = self.client.list(endpoint="cycles")
-        return cycles["cycles"]
+        return self._get_cycles_cache()[0]
+
+    def _get_cycles_cache(self) -> tuple[list, dict]:
+        def fetch():
+            cycles = self.client.list(endpoint="cycles")["cycles"]
+            return cycles, _index_by_name(cycles)
+
+        return self._cached("cycles", fetch)
+
+    def invalidate_cycles_cache(self) -> None:
+        """Forget the cached cycles so that the next lookup fetches them from SEED"""
+        self._invalidate_cache("cycles")
 
     def create_cycle(self, cycle_name: str, start_date: date, end_date: date) -> dict:
         """Name of the cycle to create. If the cycle already exists, then it will
@@ -625,6 +1093,7 @@ class SeedClient(SeedClientWrapper):
                 raise Exception(f"A cycle with this name already exists: '{cycle_name}'")
 
         cycles = self.client.post(endpoint="cycles", json=post_data)
+        self.invalidate_cycles_cache()
         return cycles["cycles"]
 
     def get_or_create_cycle(
@@ -658,21 +1127,14 @@ class SeedClient(SeedClientWrapper):
         # force the name of the cycle to be a string!
         cycle_name = str(cycle_name)
 
+        # only duplicates of the requested name matter, so collect just those
+        matches = [cycle for cycle in cycles if cycle["name"] == cycle_name]
+        if len(matches) > 1:
+            logger.warning(f"More than one cycle named '{cycle_name}' exists [found {len(matches)}]. Using the first one.")
+
         # note that this picks the first one it finds, even if there are more
         # than one cycle with the same name
-        cycle_names = [cycle["name"] for cycle in cycles]
-        counts = Counter(cycle_names)
-        for i_cycle_name, count in counts.items():
-            if count > 1:
-                msg = f"More than one cycle named '{i_cycle_name}' exists [found {count}]. Using the first one."
-                logger.warning(msg)
-                print(msg)
-
-        selected = None
-        for cycle in cycles:
-            if cycle["name"] == cycle_name:
-                selected = cycle
-                break
+        selected = matches[0] if matches else None
 
         if selected is None:
             cycle = self.create_cycle(cycle_name, start_date, end_date)
@@ -703,14 +1165,13 @@ class SeedClient(SeedClientWrapper):
                         'id': 24
                 }
         """
-        cycles = self.get_cycles()
-        for cycle in cycles:
-            if cycle["name"] == cycle_name:
-                if set_cycle_id:
-                    self.cycle_id = cycle["id"]
-                return cycle
+        cycle = self._get_cycles_cache()[1].get(cycle_name)
+        if cycle is None:
+            raise ValueError(f"cycle '{cycle_name}' not found")
 
-        raise ValueError(f"cycle '{cycle_name}' not found")
+        if set_cycle_id:
+            self.cycle_id = cycle["id"]
+        return cycle
 
     def delete_cycle(self, cycle_id: str) -> dict:
         """Delete the cycle. This will only work if there are no properties or tax lots in the cycle
@@ -722,6 +1183,7 @@ class SeedClient(SeedClientWrapper):
             dict:
         """
         result = self.client.delete(cycle_id, endpoint="cycles")
+        self.invalidate_cycles_cache()
         progress_key = result.get("progress_key", None)
 
         # wait until delete is complete
@@ -741,17 +1203,21 @@ class SeedClient(SeedClientWrapper):
         """
         post_data = {"name": dataset_name}
 
-        datasets = self.client.list(endpoint="datasets", data_name="datasets")
-        for dataset in datasets:
-            if dataset["name"] == dataset_name:
-                logger.info(f"Dataset already created, returning {dataset['name']}")
-                return dataset
+        def fetch():
+            # SEED does not enforce unique dataset names, the first one is used
+            return _index_by_name(self.client.list(endpoint="datasets", data_name="datasets"))
+
+        dataset = self._cached("datasets", fetch).get(dataset_name)
+        if dataset is not None:
+            logger.info(f"Dataset already created, returning {dataset['name']}")
+            return dataset
 
         # create a new dataset - this doesn't return the entire dict back
         # so after creating go and get the individual dataset
         dataset = self.client.post(endpoint="datasets", json=post_data)
         selected = {}
         if dataset["status"] == "success":
+            self._invalidate_cache("datasets")
             selected = self.client.get(dataset["id"], endpoint="datasets", data_name="dataset")
         return selected
 
@@ -776,21 +1242,47 @@ class SeedClient(SeedClientWrapper):
             "source_type": upload_datatype,
         }
 
-        files_params = [
-            ("file", (Path(data_file).name, open(Path(data_file).resolve(), "rb"))),  # noqa: SIM115
-        ]
-
-        return self.client.post(
-            "upload",
-            params=params,
-            files=files_params,
-        )
-
-    def track_progress_result(self, progress_key) -> dict:
+        data_path = Path(data_file)
+        with open(data_path.resolve(), "rb") as f:
+            return self.client.post("upload", **self._file_upload_kwargs(data_path.name, f, params))
+
+    @staticmethod
+    def _file_upload_kwargs(filename: str, f, params: Optional[dict] = None) -> dict:
+        """Get the client call arguments to upload an open file as multipart form data. With
+        requests-toolbelt installed (py-seed[streaming]) the file is streamed in chunks rather
+        than read into memory, and streamed again from the start if the call is retried."""
+        if MultipartEncoder is None:
+            kwargs: dict[str, Any] = {"files": [("file", (filename, f))]}
+            if params is not None:
+                kwargs["params"] = params
+            return kwargs
+
+        encoder = _RewindableMultipartEncoder(filename, f)
+        return {"params": {**(params or {}), "headers": {"Content-Type": encoder.content_type}}, "data": encoder}
+
+    def track_progress_result(
+        self,
+        progress_key,
+        interval: float = 0.05,
+        max_interval: float = 2,
+        timeout: Optional[float] = None,
+        max_failures: Optional[int] = None,
+        wait: Optional[float] = None,
+    ) -> dict:
         """Delays the sequence until progress is at 100 percent
 
         Args:
             progress_key (str): the key to track
+            interval (float): seconds to wait before the second check, the wait
+                grows by 50% after each check so that short tasks return quickly. Defaults to 0.05.
+            max_interval (float): maximum seconds to wait between checks. Defaults to 2.
+            timeout (float, optional): seconds after which to give up and raise a
+                TimeoutError. Defaults to None, which waits until the progress is done.
+            max_failures (int, optional): number of failed checks in a row after which to give up.
+                Defaults to None, which keeps checking through failures, e.g., while the server restarts.
+            wait (float, optional): ask the server to hold each check open for up to this many
+                seconds until the progress is done (long polling). Servers without long polling
+                answer right away, in which case the checks simply back off as usual. Defaults to None.
 
         Returns:
             dict: progress_result
@@ -810,27 +1302,151 @@ class SeedClient(SeedClientWrapper):
         """
         if not progress_key:
             raise Exception("No progress key provided")
+        deadline = None if timeout is None else time.monotonic() + timeout
+        failures = 0
+        while True:
+            progress_result = self._get_progress(progress_key, wait=wait)
+            if progress_result and progress_result["progress"] == 100:
+                return progress_result
+            failures = failures + 1 if progress_result is None else 0
+            if max_failures is not None and failures >= max_failures:
+                raise Exception(f"Could not get the progress of {progress_key} after {failures} attempts")
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"Progress of {progress_key} not done after {timeout} seconds")
+            time.sleep(interval)
+            interval = min(interval * 1.5, max_interval)
+
+    async def track_progress_result_async(
+        self,
+        progress_key,
+        interval: float = 0.05,
+        max_interval: float = 2,
+        timeout: Optional[float] = None,
+        max_failures: Optional[int] = None,
+    ) -> dict:
+        """Awaitable version of track_progress_result which does not block
+        the event loop while waiting, so that several progress keys can be
+        tracked concurrently, see track_many.
+
+        Args:
+            progress_key (str): the key to track
+            interval (float): seconds to wait before the second check, the wait
+                grows by 50% after each check. Defaults to 0.05.
+            max_interval (float): maximum seconds to wait between checks. Defaults to 2.
+            timeout (float, optional): seconds after which to give up and raise a
+                TimeoutError. Defaults to None, which waits until the progress is done.
+            max_failures (int, optional): number of failed checks in a row after which to give up.
+                Defaults to None, which keeps checking through failures.
+
+        Returns:
+            dict: progress_result, see track_progress_result
+        """
+        if not progress_key:
+            raise Exception("No progress key provided")
+        deadline = None if timeout is None else time.monotonic() + timeout
+        failures = 0
+        while True:
+            progress_result = await asyncio.to_thread(self._get_progress, progress_key)
+            if progress_result and progress_result["progress"] == 100:
+                return progress_result
+            failures = failures + 1 if progress_result is None else 0
+            if max_failures is not None and failures >= max_failures:
+                raise Exception(f"Could not get the progress of {progress_key} after {failures} attempts")
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"Progress of {progress_key} not done after {timeout} seconds")
+            await asyncio.sleep(interval)
+            interval = min(interval * 1.5, max_interval)
+
+    async def track_many(
+        self,
+        progress_keys: list,
+        interval: float = 1.0,
+        timeout: Optional[float] = None,
+        max_failures: Optional[int] = None,
+    ) -> list:
+        """Track several progress keys concurrently
+
+        Args:
+            progress_keys (list): the keys to track
+            interval (float): seconds to wait between checks. Defaults to 1.0.
+            timeout (float, optional): see track_progress_many. Defaults to None.
+            max_failures (int, optional): see track_progress_many. Defaults to None.
+
+        Returns:
+            list: progress_results in the same order as progress_keys
+        """
+        results = await self.track_progress_many(progress_keys, interval=interval, timeout=timeout, max_failures=max_failures)
+        return [results[key] for key in progress_keys]
+
+    async def track_progress_many(
+        self,
+        progress_keys: list,
+        interval: float = 1.0,
+        timeout: Optional[float] = None,
+        max_failures: Optional[int] = None,
+    ) -> dict:
+        """Wait until the progress of all the progress keys is at 100 percent. The keys
+        that are not done yet are all checked at once on every tick, rather than each
+        key being polled in its own loop.
+
+        Args:
+            progress_keys (list): the keys to track
+            interval (float): seconds to wait between checks. Defaults to 1.0.
+            timeout (float, optional): seconds after which to give up and raise a TimeoutError
+                naming the keys not done yet. Defaults to None, which waits until all are done.
+            max_failures (int, optional): number of failed checks in a row of a key after which to give up,
+                the raised exception names the keys that failed. Defaults to None, which keeps checking
+                through failures.
+
+        Returns:
+            dict: {progress_key: progress_result}, see track_progress_result
+        """
+        if not all(progress_keys):
+            raise Exception("No progress key provided")
+        deadline = None if timeout is None else time.monotonic() + timeout
+        results = {}
+        # {progress_key: failed checks in a row}
+        failures = dict.fromkeys(progress_keys, 0)
+        pending = list(failures)
+        while pending:
+            progress_results = await asyncio.gather(*(asyncio.to_thread(self._get_progress, key) for key in pending))
+            still_pending = []
+            for key, progress_result in zip(pending, progress_results):
+                if progress_result and progress_result["progress"] == 100:
+                    results[key] = progress_result
+                else:
+                    failures[key] = failures[key] + 1 if progress_result is None else 0
+                    still_pending.append(key)
+            pending = still_pending
+            failed = [] if max_failures is None else [key for key in pending if failures[key] >= max_failures]
+            if failed:
+                raise Exception(f"Could not get the progress of {', '.join(map(str, failed))} after {max_failures} attempts")
+            if pending and deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"Progress of {', '.join(map(str, pending))} not done after {timeout} seconds")
+            if pending:
+                await asyncio.sleep(interval)
+        return results
+
+    def _get_progress(self, progress_key, wait: Optional[float] = None) -> Optional[dict]:
+        """Get the current progress of a progress key, None if the progress could
+        not be retrieved for now, e.g., while SEED restarts. Other errors are raised."""
+        # only long poll when asked to, the query string is otherwise unchanged
+        params = {} if wait is None else {"wait": wait}
         try:
-            progress_result = self.client.get(
+            return self.client.get(
                 None,
                 required_pk=False,
                 endpoint="progress",
                 url_args={"PROGRESS_KEY": progress_key},
+                **params,
             )
-        except Exception:  # noqa: BLE001
-            logger.error("Other unknown exception caught")
-            progress_result = None
+        except _transient_errors() as err:
+            if not _is_transient_error(err):
+                raise
+            logger.warning(f"Could not get the progress of {progress_key}, checking again: {err}")
+            return None
 
-        if progress_result and progress_result["progress"] == 100:
-            return progress_result
-        else:
-            # wait a couple seconds before checking the status again
-            time.sleep(2)
-            progress_result = self.track_progress_result(progress_key)
-
-        return progress_result
-
-    def get_column_mapping_profiles(self, profile_type: str = "All") -> dict:
+    def get_column_mapping_profiles(self, profile_type: str = "All") -> list:
         """get the list of column mapping profiles. If profile_type is provided
         then return the list of profiles of that type.
 
@@ -838,21 +1454,12 @@ class SeedClient(SeedClientWrapper):
             profile_type (str, optional): Type of column mappings to return, can be 'Normal', 'BuildingSync Default'. Defaults to 'All', which includes both Normal and BuildingSync.
 
         Returns:
-            dict: column mapping profiles
+            list: column mapping profiles
         """
-        result = self.client.post(endpoint="column_mapping_profiles_filter")
-        indices_to_remove = []
-        for index, item in enumerate(result):
-            if profile_type == "All":
-                continue
-            elif item["profile_type"] != profile_type:
-                indices_to_remove.append(index)
-
-        # return only the unmarked indices
-        if indices_to_remove:
-            result = [item for index, item in enumerate(result) if index not in indices_to_remove]
-
-        return result
+        profiles = self._column_mapping_profiles_cached()[0]
+        if profile_type != "All":
+            profiles = [item for item in profiles if item["profile_type"] == profile_type]
+        return profiles
 
     def get_column_mapping_profile(self, column_mapping_profile_name: str) -> Optional[dict]:
         """get a specific column mapping profile. Currently, filter does not take an
@@ -865,13 +1472,18 @@ class SeedClient(SeedClientWrapper):
         Returns:
             dict: single column mapping profile
         """
-        results = self.client.post(endpoint="column_mapping_profiles_filter")
-        for item in results:
-            if item["name"] == column_mapping_profile_name:
-                return item
+        return self._column_mapping_profiles_cached()[1].get(column_mapping_profile_name)
 
-        # if nothing, then return none
-        return None
+    def _column_mapping_profiles_cached(self) -> tuple[list, dict]:
+        """Get the column mapping profiles of the organization and a {name: profile}
+        lookup of them. The profiles are reused for CACHE_TTL seconds, profiles created
+        or updated through this client are kept up to date in the cache."""
+
+        def fetch():
+            profiles = self.client.post(endpoint="column_mapping_profiles_filter")
+            return profiles, _index_by_name(profiles)
+
+        return self._cached("column_mapping_profiles", fetch)
 
     def create_or_update_column_mapping_profile(self, mapping_profile_name: str, mappings: list) -> dict:
         """Create or update an existing mapping profile from a list of mappings
@@ -911,8 +1523,8 @@ class SeedClient(SeedClientWrapper):
                 ]
             }
         """
-        # see if the column mapping profile already exists
-        profile = self.get_column_mapping_profile(mapping_profile_name)
+        # see if the column mapping profile already exists, only its id is needed
+        profile = self._column_mapping_profiles_cached()[1].get(mapping_profile_name)
         result = None
         if not profile:
             # The profile doesn't exist, so create a new one. Note that seed does not
@@ -930,8 +1542,26 @@ class SeedClient(SeedClientWrapper):
             }
             result = self.client.put(profile["id"], endpoint="column_mapping_profiles", json=payload)
 
+        self._update_column_mapping_profiles_cache(mapping_profile_name, result)
         return result
 
+    def _update_column_mapping_profiles_cache(self, mapping_profile_name: str, profile: dict) -> None:
+        """Store a created or updated profile in the cached profiles instead of refetching them"""
+        if not isinstance(profile, dict) or profile.get("id") is None:
+            # unexpected response, fetch the profiles again on the next lookup
+            self._invalidate_cache("column_mapping_profiles")
+            return
+
+        def update(cached):
+            profiles, by_name = cached
+            if any(item["id"] == profile["id"] for item in profiles):
+                profiles = [profile if item["id"] == profile["id"] else item for item in profiles]
+            else:
+                profiles = [*profiles, profile]
+            return profiles, {**by_name, mapping_profile_name: profile}
+
+        self._update_cached("column_mapping_profiles", update)
+
     def create_or_update_column_mapping_profile_from_file(self, mapping_profile_name: str, mapping_file: str) -> dict:
         """creates or updates a mapping profile. The format of the mapping file is a CSV with the following format:
 
@@ -962,7 +1592,9 @@ class SeedClient(SeedClientWrapper):
         if not Path(mapping_file).exists():
             raise Exception(f"Could not find mapping file: {mapping_file}")
 
-        return self.create_or_update_column_mapping_profile(mapping_profile_name, read_map_file(mapping_file))
+        stat = Path(mapping_file).stat()
+        mappings = _read_map_file_cached(str(mapping_file), stat.st_mtime_ns, stat.st_size)
+        return self.create_or_update_column_mapping_profile(mapping_profile_name, mappings)
 
     def set_import_file_column_mappings(self, import_file_id: int, mappings: list) -> dict:
         """Sets the column mappings onto the import file record.
@@ -974,15 +1606,27 @@ class SeedClient(SeedClientWrapper):
         Returns:
             dict: dict of status
         """
+        # mapping onto new fields creates extra data columns
+        self.invalidate_columns_cache()
         return self.client.post(
-            "org_column_mapping_import_file",
-            url_args={"ORG_ID": self.client.org_id},
+            self._org_endpoint_url("org_column_mapping_import_file"),
             params={"import_file_id": import_file_id},
             json={"mappings": mappings},
         )
 
+    def _org_endpoint_url(self, endpoint: str) -> str:
+        """Get the url of an endpoint that is templated on ORG_ID for the current
+        organization. The url is resolved once per organization."""
+        key = (endpoint, self.client.org_id)
+        url = self._org_urls.get(key)
+        if url is None:
+            url = _replace_url_args(self.client.urls[endpoint], {"ORG_ID": self.client.org_id})
+            self._org_urls[key] = url
+        return url
+
     def get_columns(self) -> dict:
-        """Get the list of columns
+        """Get the list of columns. The list is reused for CACHE_TTL seconds, or
+        until columns are created or mapped through this client.
 
         Returns:
             dict: {
@@ -990,8 +1634,15 @@ class SeedClient(SeedClientWrapper):
                     "columns: [{...}]
                   }
         """
-        result = self.client.list(endpoint="columns")
-        return result
+        return self._columns_cached()
+
+    def _columns_cached(self) -> dict:
+        return self._cached("columns", lambda: self.client.list(endpoint="columns"))
+
+    def invalidate_columns_cache(self) -> None:
+        """Forget the cached columns so that the next lookup fetches them from SEED"""
+        self._invalidate_cache("columns")
+        self._invalidate_cache("extra_data_column_names")
 
     def create_extra_data_column(
         self,
@@ -1020,39 +1671,27 @@ class SeedClient(SeedClientWrapper):
                     }
                   }
         """
-        # get extra data columns (only)
-        result = self.client.list(endpoint="columns")
-        columns = result["columns"]
-        extra_data_cols = [item for item in columns if item["is_extra_data"]]
-
         # see if extra data column already exists (for now don't update it, just skip it)
-        res = list(filter(lambda extra_data_cols: extra_data_cols["column_name"] == column_name, extra_data_cols))
-        if res:
-            # column already exists
-            result = {"status": "noop", "message": "column already exists"}
-        else:
-            # create
-            payload = {
-                "column_name": column_name,
-                "display_name": display_name,
-                "table_name": "PropertyState" if inventory_type == "Property" else "TaxLotState",
-                "column_description": column_description,
-                "data_type": data_type,
-                "organization_id": self.get_org_id(),
-            }
-            result = self.client.post(endpoint="columns", json=payload)
+        if column_name in self._extra_data_column_names():
+            return {"status": "noop", "message": "column already exists"}
 
-        return result
+        return self._post_extra_data_column(column_name, display_name, inventory_type, column_description, data_type)
 
-    def create_extra_data_columns_from_file(self, columns_csv_filepath: str) -> list:
+    def create_extra_data_columns_from_file(self, columns_csv_filepath: str, max_workers: int = 8) -> list:
         """Create extra data columns from a csv file. if column exist, skip.
 
         Args:
             'columns_csv_filepath': 'path/to/file'
             file is expected to have headers: column_name, display_name, column_description,
+                inventory_type, data_type
+            'max_workers': maximum number of columns to create at once. Defaults to 8.
 
             See example file at tests/data/test-seed-create-columns.csv
 
+        Raises:
+            ValueError: if the file is missing headers or has an invalid row. The whole file
+                is checked before any column is created.
+
         Returns:
             list:[{
                     "status": "success",
@@ -1063,18 +1702,60 @@ class SeedClient(SeedClientWrapper):
                     }
                   }]
         """
-        # open file in read mode
-        with open(columns_csv_filepath) as f:
-            dict_reader = DictReader(f)
-            columns = list(dict_reader)
+        # validate the file before talking to SEED, then check all the columns against a
+        # single listing of the existing columns, and create the missing ones concurrently
+        rows = _read_extra_data_columns_file(columns_csv_filepath)
+        existing_names = set(self._extra_data_column_names())
+        results: list[Optional[dict]] = []
+        # (index in results, args of _post_extra_data_column)
+        to_create = []
+
+        for args in rows:
+            column_name = args[0]
+            if column_name in existing_names:
+                results.append({"status": "noop", "message": "column already exists"})
+            else:
+                # later rows with the same name are skipped, as they were when created one by one
+                existing_names.add(column_name)
+                to_create.append((len(results), args))
+                results.append(None)
 
-        results = []
-        for col in columns:
-            result = self.create_extra_data_column(**col)
-            results.append(result)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            created = executor.map(lambda item: self._post_extra_data_column(*item[1]), to_create)
+            for (index, _), result in zip(to_create, created):
+                results[index] = result
 
         return results
 
+    def _extra_data_column_names(self) -> frozenset:
+        """Get the names of the extra data columns of the organization. SEED cannot
+        filter the columns on is_extra_data, so the names are collected once per
+        listing of the columns."""
+
+        def fetch():
+            return frozenset(item["column_name"] for item in self._columns_cached()["columns"] if item["is_extra_data"])
+
+        return self._cached("extra_data_column_names", fetch)
+
+    def _post_extra_data_column(
+        self,
+        column_name: str,
+        display_name: str,
+        inventory_type: str,
+        column_description: str,
+        data_type: str,
+    ) -> dict:
+        payload = {
+            "column_name": column_name,
+            "display_name": display_name,
+            "table_name": "PropertyState" if inventory_type == "Property" else "TaxLotState",
+            "column_description": column_description,
+            "data_type": data_type,
+            "organization_id": self.get_org_id(),
+        }
+        self.invalidate_columns_cache()
+        return self.client.post(endpoint="columns", json=payload)
+
     def get_meters(self, property_id: int) -> list:
         """Return the list of meters assigned to a property (the property view id).
         Note that meters are attached to the property (not the state nor the property view).
@@ -1098,6 +1779,33 @@ class SeedClient(SeedClientWrapper):
         meters = self.client.get(None, required_pk=False, endpoint="properties_meters", url_args={"PK": property_id})
         return meters
 
+    def map_properties(self, fn: Callable, property_ids: list, max_workers: int = 16) -> list:
+        """Call fn for each of the property ids. The calls are independent requests, so they are
+        made concurrently over the pooled session of the client instead of one after another.
+
+        Args:
+            fn (Callable): function taking a property id, e.g., self.get_meters
+            property_ids (list): property ids to call fn with
+            max_workers (int, optional): maximum number of calls made at once. Defaults to 16.
+
+        Returns:
+            list: the result of fn for each property id, in the order of property_ids
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(fn, property_ids))
+
+    def get_meters_bulk(self, property_ids: list, max_workers: int = 16) -> list:
+        """Return the meters of several properties, see get_meters and map_properties.
+
+        Args:
+            property_ids (list): property ids to get the meters
+            max_workers (int, optional): maximum number of requests made at once. Defaults to 16.
+
+        Returns:
+            list: the list of meters of each property, in the order of property_ids
+        """
+        return self.map_properties(self.get_meters, property_ids, max_workers)
+
     def get_meter(self, property_view_id: int, meter_type: str, source: str, source_id: str) -> Union[dict, None]:
         """get a meter for a property view.
 
@@ -1107,15 +1815,32 @@ class SeedClient(SeedClientWrapper):
             source (str): Of GreenButton, Portfolio Manager, or Custom Meter
             source_id (str): Identifier, if GreenButton, then format is xpath like
 
+        Note that the meters of the property are reused for CACHE_TTL seconds and kept up to date
+        with the meters created, deleted or imported through this client. Call invalidate_meters_cache
+        after meters are imported by others, or use get_meters for the current meters.
+
         Returns:
             dict: meter object
         """
-        # return all the meters for the property and see if the meter exists, if so, return it
-        meters = self.get_meters(property_view_id)
-        for meter in meters:
-            if meter["type"] == meter_type and meter["source"] == source and meter["source_id"] == source_id:
-                return meter
-        return None
+        # look the meter up in an index of all the meters of the property
+        meters_index = self._cached("meters", self._index_meters, property_view_id)
+        return meters_index.get((meter_type, source, source_id))
+
+    def _index_meters(self, property_view_id: int) -> dict:
+        """Get the meters of a property as a {(type, source, source_id): meter} lookup"""
+        meters_index: dict[tuple[str, str, str], dict] = {}
+        for meter in self.get_meters(property_view_id):
+            # keep the first meter, as a scan of the meters would
+            meters_index.setdefault((meter["type"], meter["source"], meter["source_id"]), meter)
+        return meters_index
+
+    def invalidate_meters_cache(self, property_view_id: Optional[int] = None) -> None:
+        """Forget the cached meters of a property, or of all properties, so that the
+        next lookup fetches them from SEED, e.g., after meters were imported from a file"""
+        if property_view_id is None:
+            self._invalidate_cache("meters")
+        else:
+            self._invalidate_cache("meters", property_view_id)
 
     def get_or_create_meter(self, property_view_id: int, meter_type: str, source: str, source_id: str) -> Optional[dict[Any, Any]]:
         """get or create a meter for a property view.
@@ -1143,6 +1868,13 @@ class SeedClient(SeedClientWrapper):
 
             meter = self.client.post(endpoint="properties_meters", url_args={"PK": property_view_id}, json=payload)
 
+            # add the new meter to the cached meters rather than listing them again
+            self._update_cached(
+                "meters",
+                lambda meters_index: {**meters_index, (meter_type, source, source_id): meter},
+                property_view_id,
+            )
+
             return meter
 
     def delete_meter(self, property_view_id: int, meter_id: int) -> dict:
@@ -1155,15 +1887,36 @@ class SeedClient(SeedClientWrapper):
         Returns:
             dict: status of the deletion
         """
-        return self.client.delete(meter_id, endpoint="properties_meters", url_args={"PK": property_view_id})
+        result = self.client.delete(meter_id, endpoint="properties_meters", url_args={"PK": property_view_id})
+
+        self._update_cached(
+            "meters",
+            lambda meters_index: {key: meter for key, meter in meters_index.items() if meter["id"] != meter_id},
+            property_view_id,
+        )
+
+        return result
 
-    def upsert_meter_readings_bulk(self, property_view_id: int, meter_id: int, data: list) -> dict:
+    def upsert_meter_readings_bulk(
+        self,
+        property_view_id: int,
+        meter_id: int,
+        data: list,
+        chunk_size: Optional[int] = None,
+        compress: bool = False,
+    ) -> dict:
         """Upsert meter readings for a property's meter with the bulk method.
 
         Args:
             property_view_id (int): property view id
             meter_id (int): meter id
             data (list): list of dictionaries of meter readings
+            chunk_size (int, optional): upsert the readings in calls of at most chunk_size readings,
+                e.g., to keep each request of a long interval series under the server's size limits.
+                Defaults to None, which sends all the readings in one call.
+            compress (bool, optional): send the readings gzipped, which shrinks large uploads several
+                times over. Only use this if the SEED server (or its proxy) decompresses request
+                bodies. Defaults to False.
 
         Returns:
             dict: list of all meter reading objects
@@ -1173,6 +1926,8 @@ class SeedClient(SeedClientWrapper):
             endpoint="properties_meters_reading",
             url_args={"PK": property_view_id, "METER_PK": meter_id},
             json=data,
+            chunk_size=chunk_size,
+            compress=compress,
         )
         return readings
 
@@ -1378,30 +2133,26 @@ class SeedClient(SeedClientWrapper):
         # Get the "properties" key from the dictionary.
         properties = response["properties"]
 
-        # Create an XLSX workbook object.
-        workbook = Workbook()
+        # openpyxl is slow to import and only needed here, so import it on first use
+        from openpyxl import Workbook
 
-        # Create a sheet object in the workbook.
-        sheet = workbook.active
+        # Get the header row from the API response, the keys of all the properties
+        # in the order they first appear
+        header_row = list(dict.fromkeys(key for prop in properties for key in prop))
 
-        # Get the header row from the API response.
-        header_row = []
-        for prop in properties:
-            for key in prop:
-                if key not in header_row:
-                    header_row.append(key)
+        # Get the data rows before creating the workbook, so a bad property does not
+        # leave a half written workbook behind
+        rows = [[prop[key] for key in header_row] for prop in properties]
 
-        # Write the header row to the sheet object.
-        if sheet:
-            sheet.append(header_row)
+        # Create an XLSX workbook object. The rows are only ever appended, so use the
+        # write-only mode which streams them to the file instead of keeping every cell
+        workbook = Workbook(write_only=True)
 
-        # Loop over the list of dictionaries and write the data to the sheet object.
-        for prop in properties:
-            row = []
-            for key in header_row:
-                row.append(prop[key])
-            if sheet:
-                sheet.append(row)
+        # Create a sheet object in the workbook and write the header and data rows.
+        sheet = workbook.create_sheet()
+        sheet.append(header_row)
+        for row in rows:
+            sheet.append(row)
 
         # Report Template name
         report_template_name = pm_template["name"]
@@ -1471,6 +2222,10 @@ class SeedClient(SeedClientWrapper):
         Kwargs:
             datafile_type (str): Type of datafile
             multiple_cycle_upload (bool): Whether to use multiple cycle upload. Defaults to False.
+            use_ingest_cache (bool): Return the matching summary of an earlier run that ingested the same
+                datafile with the same mappings into the same dataset and cycle, instead of ingesting it
+                again. The summaries are kept in INGEST_CACHE_DIR, or ~/.seed_client_cache if that is not
+                set. Defaults to False.
 
 
         Returns:
@@ -1479,20 +2234,41 @@ class SeedClient(SeedClientWrapper):
             }
         """
         datafile_type = kwargs.pop("datafile_type", "Assessed Raw")
+        multiple_cycle_upload = kwargs.pop("multiple_cycle_upload", False)
+        cache_path = None
+        if kwargs.pop("use_ingest_cache", False):
+            cache_path = self._ingest_cache_path(
+                dataset_name,
+                datafile,
+                column_mapping_profile_name,
+                column_mappings_file,
+                import_meters_if_exist,
+                datafile_type,
+                multiple_cycle_upload,
+            )
+            if cache_path.exists():
+                return json_loads(cache_path.read_bytes())
+
         dataset = self.get_or_create_dataset(dataset_name)
         result = self.upload_datafile(dataset["id"], datafile, datafile_type)
         import_file_id = result["import_file_id"]
-        multiple_cycle_upload = kwargs.pop("multiple_cycle_upload", False)
 
         # start processing
         result = self.start_save_data(import_file_id, multiple_cycle_upload)
         progress_key = result.get("progress_key", None)
 
-        # wait until upload is complete
-        result = self.track_progress_result(progress_key)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # create/retrieve the column mappings while SEED saves the data, the
+            # profile does not depend on the saved data
+            profile = executor.submit(
+                self.create_or_update_column_mapping_profile_from_file,
+                column_mapping_profile_name,
+                column_mappings_file,
+            )
 
-        # create/retrieve the column mappings
-        result = self.create_or_update_column_mapping_profile_from_file(column_mapping_profile_name, column_mappings_file)
+            # wait until upload is complete
+            result = self.track_progress_result(progress_key)
+            result = profile.result()
 
         # set the column mappings for the dataset
         result = self.set_import_file_column_mappings(import_file_id, result["mappings"])
@@ -1526,6 +2302,217 @@ class SeedClient(SeedClientWrapper):
 
             # wait until upload is complete
             result = self.track_progress_result(progress_key)
+            # the imported meters are not in the cached meters
+            self.invalidate_meters_cache()
+
+        if cache_path is not None:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(json.dumps(matching_results))
+
+        return matching_results
+
+    def _ingest_cache_path(
+        self,
+        dataset_name: str,
+        datafile: str,
+        column_mapping_profile_name: str,
+        column_mappings_file: str,
+        *options,
+    ) -> Path:
+        """Get the file that keeps the matching summary of ingesting datafile. The file is
+        named after everything the summary depends on: the SEED instance, organization,
+        cycle, dataset, the contents of the datafile and the mapping file, and the options
+        of upload_and_match_datafile."""
+        key = [
+            self.client.base_url,
+            self.client.org_id,
+            self.cycle_id,
+            dataset_name,
+            _file_sha256(datafile),
+            column_mapping_profile_name,
+            _file_sha256(column_mappings_file),
+            *options,
+        ]
+        # resolve the home directory only once the cache is used
+        cache_dir = self.INGEST_CACHE_DIR or Path.home() / ".seed_client_cache"
+        return cache_dir / f"{hashlib.sha256(json.dumps(key).encode()).hexdigest()}.json"
+
+    async def upload_and_match_datafile_async(
+        self,
+        dataset_name: str,
+        datafile: str,
+        column_mapping_profile_name: str,
+        column_mappings_file: str,
+        import_meters_if_exist: bool = False,
+        **kwargs,
+    ) -> dict:
+        """Awaitable version of upload_and_match_datafile so that one event loop can carry
+        many datafiles through the ingestion process at once. The column mapping profile is
+        created/updated while SEED saves the data.
+
+        Args:
+            dataset_name (str): Name of the dataset to upload to
+            datafile (str): Full path to the datafile to upload
+            column_mapping_profile_name (str): Name of the column mapping profile to use
+            column_mappings_file (str): Mapping that will be uploaded to the column_mapping_profile_name
+            import_meters_if_exist (bool): If true, will import meters from the meter tab if they exist in the datafile. Defaults to False.
+
+        Kwargs:
+            datafile_type (str): Type of datafile
+            multiple_cycle_upload (bool): Whether to use multiple cycle upload. Defaults to False.
+            use_ingest_cache (bool): Return the matching summary of an earlier run instead of ingesting
+                the datafile again, see upload_and_match_datafile. Defaults to False.
+
+        Returns:
+            dict: {
+                matching summary
+            }
+        """
+        dataset = await asyncio.to_thread(self.get_or_create_dataset, dataset_name)
+        return await self._ingest_datafile_async(
+            dataset_name,
+            dataset["id"],
+            datafile,
+            column_mapping_profile_name,
+            column_mappings_file,
+            lambda: asyncio.to_thread(
+                self.create_or_update_column_mapping_profile_from_file,
+                column_mapping_profile_name,
+                column_mappings_file,
+            ),
+            import_meters_if_exist,
+            kwargs.pop("datafile_type", "Assessed Raw"),
+            kwargs.pop("multiple_cycle_upload", False),
+            kwargs.pop("use_ingest_cache", False),
+        )
+
+    async def run_import_pipeline(
+        self,
+        dataset_name: str,
+        datafiles: list,
+        column_mapping_profile_name: str,
+        column_mappings_file: str,
+        datafile_type: str = "Assessed Raw",
+        multiple_cycle_upload: bool = False,
+        concurrency: int = 8,
+        import_meters_if_exist: bool = False,
+        use_ingest_cache: bool = False,
+    ) -> list:
+        """Upload several files to the cycle_id that is defined in the constructor and carry
+        each of them through the ingestion process (map, merge, pair, geocode), see
+        upload_and_match_datafile. The files are processed concurrently so that the uploads
+        and the waits for SEED to process one file overlap with the other files.
+
+        Args:
+            dataset_name (str): Name of the dataset to upload to
+            datafiles (list): Full paths to the datafiles to upload
+            column_mapping_profile_name (str): Name of the column mapping profile to use
+            column_mappings_file (str): Mapping that will be uploaded to the column_mapping_profile_name
+            datafile_type (str): Type of datafile. Defaults to "Assessed Raw".
+            multiple_cycle_upload (bool): Whether to use multiple cycle upload. Defaults to False.
+            concurrency (int): Maximum number of files processed at once. Defaults to 8.
+            import_meters_if_exist (bool): If true, will import meters from the meter tab if they exist in a datafile. Defaults to False.
+            use_ingest_cache (bool): Return the matching summary of an earlier run instead of ingesting
+                a datafile again, see upload_and_match_datafile. Defaults to False.
+
+        Returns:
+            list: matching summary of each datafile, in the same order as datafiles
+        """
+        # the dataset and the profile are shared by all the datafiles, so they are only
+        # created/updated once
+        dataset = await asyncio.to_thread(self.get_or_create_dataset, dataset_name)
+        profile = await asyncio.to_thread(
+            self.create_or_update_column_mapping_profile_from_file,
+            column_mapping_profile_name,
+            column_mappings_file,
+        )
+
+        async def get_profile() -> dict:
+            return profile
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def import_datafile(datafile):
+            async with semaphore:
+                return await self._ingest_datafile_async(
+                    dataset_name,
+                    dataset["id"],
+                    datafile,
+                    column_mapping_profile_name,
+                    column_mappings_file,
+                    get_profile,
+                    import_meters_if_exist,
+                    datafile_type,
+                    multiple_cycle_upload,
+                    use_ingest_cache,
+                )
+
+        return await asyncio.gather(*(import_datafile(datafile) for datafile in datafiles))
+
+    async def _ingest_datafile_async(
+        self,
+        dataset_name: str,
+        dataset_id: int,
+        datafile: str,
+        column_mapping_profile_name: str,
+        column_mappings_file: str,
+        get_profile: Callable[[], Awaitable[dict]],
+        import_meters_if_exist: bool,
+        datafile_type: str,
+        multiple_cycle_upload: bool,
+        use_ingest_cache: bool,
+    ) -> dict:
+        """Carry one datafile through the ingestion process for upload_and_match_datafile_async
+        and run_import_pipeline. get_profile is awaited while SEED saves the data and returns
+        the column mapping profile to use."""
+        cache_path = None
+        if use_ingest_cache:
+            cache_path = await asyncio.to_thread(
+                self._ingest_cache_path,
+                dataset_name,
+                datafile,
+                column_mapping_profile_name,
+                column_mappings_file,
+                import_meters_if_exist,
+                datafile_type,
+                multiple_cycle_upload,
+            )
+            if cache_path.exists():
+                return json_loads(await asyncio.to_thread(cache_path.read_bytes))
+
+        # each step of a file needs the previous one to be done, so a file only has one
+        # progress key at a time; the keys are polled on their own rather than with
+        # track_progress_many, which would have to wait for the slowest file on every step
+        result = await asyncio.to_thread(self.upload_datafile, dataset_id, datafile, datafile_type)
+        import_file_id = result["import_file_id"]
+
+        result = await asyncio.to_thread(self.start_save_data, import_file_id, multiple_cycle_upload)
+        # the column mapping profile is prepared while SEED saves the data
+        profile: dict
+        _, profile = await asyncio.gather(
+            self.track_progress_result_async(result.get("progress_key", None)),
+            get_profile(),
+        )
+
+        await asyncio.to_thread(self.set_import_file_column_mappings, import_file_id, profile["mappings"])
+        result = await asyncio.to_thread(self.start_map_data, import_file_id)
+        await self.track_progress_result_async(result.get("progress_key", None))
+
+        result = await asyncio.to_thread(self.start_system_matching_and_geocoding, import_file_id)
+        await self.track_progress_result_async(result["progress_data"].get("progress_key", None))
+
+        matching_results = await asyncio.to_thread(self.get_matching_results, import_file_id)
+
+        if import_meters_if_exist and await asyncio.to_thread(self.check_meters_tab_exist, import_file_id):
+            reuse_file = await asyncio.to_thread(self.import_files_reuse_inventory_file_for_meters, import_file_id)
+            result = await asyncio.to_thread(self.start_save_data, reuse_file["import_file_id"])
+            await self.track_progress_result_async(result.get("progress_key", None))
+            # the imported meters are not in the cached meters
+            self.invalidate_meters_cache()
+
+        if cache_path is not None:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            await asyncio.to_thread(cache_path.write_text, json.dumps(matching_results))
 
         return matching_results
 
@@ -1653,13 +2640,18 @@ class SeedClient(SeedClientWrapper):
             "portfolio_manager_property_download",
             json={"username": username, "password": password},
             url_args={"PK": pm_property_id},
+            stream=True,
         )
         result = {"status": "error"}
         # save the file to the location that was passed
-        # note that the data are returned directly (the ESPM URL directly downloads the file)
-        if isinstance(response, bytes):
-            with open(save_file_name, "wb") as f:
-                f.write(response)
+        # note that the data are returned directly (the ESPM URL directly downloads the file),
+        # so write them as they arrive rather than holding the whole file in memory
+        with closing(response):
+            if _XLSX_CONTENT_TYPE in response.headers.get("Content-Type", ""):
+                # requests responses iterate with iter_content, httpx responses with iter_bytes
+                iter_chunks = getattr(response, "iter_content", None) or response.iter_bytes
+                with open(save_file_name, "wb") as f:
+                    f.writelines(iter_chunks(_DOWNLOAD_CHUNK_SIZE))
                 result["status"] = "success"
         return result
 
@@ -1673,21 +2665,20 @@ class SeedClient(SeedClientWrapper):
         ESPM file will have meter data that we want to handle (electricity and natural gas)
         in the 'Meter Entries' tab"""
 
-        files_params = [
-            ("file", (Path(file_path).name, open(Path(file_path).resolve(), "rb"))),  # noqa: SIM115
-        ]
-
-        response = self.client.put(
-            None,
-            required_pk=False,
-            endpoint="property_update_with_espm",
-            url_args={"PK": seed_id},
-            files=files_params,
-            cycle_id=cycle_id,
-            mapping_profile_id=mapping_profile_id,
-        )
-
-        return response
+        espm_path = Path(file_path)
+        with open(espm_path.resolve(), "rb") as f:
+            result = self.client.put(
+                None,
+                required_pk=False,
+                endpoint="property_update_with_espm",
+                url_args={"PK": seed_id},
+                cycle_id=cycle_id,
+                mapping_profile_id=mapping_profile_id,
+                **self._file_upload_kwargs(espm_path.name, f),
+            )
+        # the meters of the ESPM file are not in the cached meters
+        self.invalidate_meters_cache(seed_id)
+        return result
 
     def retrieve_analyses_for_property(self, property_id: int) -> dict:
         """Retrieve a list of all the analyses for a single property id. Since this
@@ -1708,6 +2699,19 @@ class SeedClient(SeedClientWrapper):
             include_org_id_query_param=True,
         )
 
+    def retrieve_analyses_bulk(self, property_ids: list, max_workers: int = 16) -> list:
+        """Retrieve the analyses of several properties, see retrieve_analyses_for_property
+        and map_properties.
+
+        Args:
+            property_ids (list): Property ids to return the list of analyses
+            max_workers (int, optional): maximum number of requests made at once. Defaults to 16.
+
+        Returns:
+            list: the analyses of each property, in the order of property_ids
+        """
+        return self.map_properties(self.retrieve_analyses_for_property, property_ids, max_workers)
+
     def retrieve_analysis_result(self, analysis_id: int, analysis_view_id: int) -> dict:
         """Return the detailed JSON of a single analysis view. The endpoint in SEED is
         typically: https://dev1.seed-platform.org/app/#/analyses/274/runs/14693.
@@ -20,13 +20,34 @@ caching.
 
 """
 
+import functools
 import inspect
+from contextlib import closing
+from collections.abc import Callable
+from typing import Any, Optional
 
 import requests
 
-from pyseed.apibase import JSONAPI, OAuthMixin, UserAuthMixin, add_pk
+from pyseed.apibase import _MISSING, JSONAPI, OAuthMixin, UserAuthMixin, add_pk
 from pyseed.exceptions import SEEDError
 
+# None when orjson is not installed, requests then handles the json
+json_dumps: Optional[Callable[..., Any]]
+json_loads: Optional[Callable[..., Any]]
+try:
+    from orjson import OPT_NON_STR_KEYS
+    from orjson import dumps as _orjson_dumps
+    from orjson import loads as json_loads
+except ImportError:
+    json_dumps = json_loads = None
+else:
+    # like the json module, accept non-str keys
+    json_dumps = functools.partial(_orjson_dumps, option=OPT_NON_STR_KEYS)
+
+_XLSX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+# content types of the files that streamed responses are left unread for
+_FILE_CONTENT_TYPES = (_XLSX_CONTENT_TYPE, "application/pdf")
+
 # Constants (Should end with a slash)
 URLS = {
     "v3": {
@@ -89,7 +110,8 @@ def _get_urls(base_url, url_map=None, version=None):
     version = version if version else "v3"
     if not url_map:
         url_map = URLS[version]
-    return {key: "{}/{}".format(base_url.rstrip("/"), val.lstrip("/")) for key, val in url_map.items()}
+    base_url = base_url.rstrip("/")
+    return {key: f"{base_url}/{val.lstrip('/')}" for key, val in url_map.items()}
 
 
 def _set_default(obj, key, val, required=True):
@@ -107,6 +129,24 @@ def _set_default(obj, key, val, required=True):
     return val
 
 
+def _decode_json(response):
+    """Decode a JSON response body, using orjson when it is installed
+    (py-seed[speedups]) as it is considerably faster on large pages."""
+    if json_loads is None or not response.content:
+        return response.json()
+    return json_loads(response.content)
+
+
+def _read_body(response):
+    """Read the whole body of a streamed response, requests reads it when
+    the content is first accessed, httpx only when asked to."""
+    read = getattr(response, "read", None)
+    if read is not None:
+        read()
+    else:
+        _ = response.content
+
+
 def _replace_url_args(url, url_args):
     """Replace any custom string URL items with values in args"""
     if url_args:
@@ -180,6 +220,8 @@ class SEEDBaseClient(JSONAPI):
         **kwargs,
     ):
         use_ssl = use_ssl if use_ssl is not None else True
+        # serialize json bodies with orjson if it is installed (py-seed[speedups])
+        kwargs.setdefault("json_encoder", json_dumps)
         super().__init__(username=username, password=password, use_ssl=use_ssl, use_auth=True, access_token=access_token, **kwargs)
         self.org_id = org_id
         self.token = access_token
@@ -209,6 +251,8 @@ class SEEDBaseClient(JSONAPI):
         """
         error = False
         error_msg = "Unknown error from SEED API"
+        # the decoded body is reused by every check below
+        body = _MISSING
 
         # grab the response content type to determine json, spreadsheet, or text
         response_content_types = response.headers.get("Content-Type", [])
@@ -223,7 +267,7 @@ class SEEDBaseClient(JSONAPI):
         elif response.status_code == 204:
             # there will not be response content with a 204
             error = False
-        elif "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet" in response_content_types:
+        elif _XLSX_CONTENT_TYPE in response_content_types:
             # spreadsheet response
             error = False
         elif "application/pdf" in response_content_types:
@@ -233,9 +277,9 @@ class SEEDBaseClient(JSONAPI):
             # get as text
             if not response.content:
                 error = True
-        elif isinstance(response.json(), dict):
-            status_field = response.json().get("status", None)
-            has_progress_key = "progress_key" in response.json()
+        elif isinstance(body := _decode_json(response), dict):
+            status_field = body.get("status", None)
+            has_progress_key = "progress_key" in body
             if status_field:
                 if has_progress_key:
                     # For the delete cycles, the data returned have a status and a progress_key,
@@ -247,17 +291,15 @@ class SEEDBaseClient(JSONAPI):
                 elif status_field == "success":
                     # continue
                     error = False
-            elif "success" in response.json():
-                success_flag = response.json().get("success", None)
+            elif "success" in body:
+                success_flag = body.get("success", None)
                 # For file uploads the response key is 'success'
                 error = not success_flag
-            elif "progress_data" in response.json():
+            elif "progress_data" in body:
                 # this is a system matching response, which is okay. return the success flag of this
-                status_flag = response.json()["progress_data"].get("status", None)
+                status_flag = body["progress_data"].get("status", None)
                 error = status_flag not in ["not-started", "success", "parsing"]
-            elif not any(
-                key in ["results", "readings", "data", "status", "id", "organizations", "sha", "users"] for key in response.json()
-            ):
+            elif not any(key in ["results", "readings", "data", "status", "id", "organizations", "sha", "users"] for key in body):
                 # In some cases there is not a 'status' field, so check if there are
                 # any other keys in the response that depict a success:
                 # readings - this comes from meters
@@ -268,16 +310,18 @@ class SEEDBaseClient(JSONAPI):
                 # sha - When parsing the version of SEED
                 error = True
 
-        elif not isinstance(response.json(), list):
+        elif not isinstance(body, list):
             error = True
 
         if error:
             if response.content:
                 try:
-                    if getattr(response.json(), "get", None):
-                        error_msg = response.json().get("message", f"Unknown SEED Error {response.status_code}: {response.json()}")
+                    if body is _MISSING:
+                        body = _decode_json(response)
+                    if getattr(body, "get", None):
+                        error_msg = body.get("message", f"Unknown SEED Error {response.status_code}: {body}")
                     else:
-                        error_msg = f"Unknown SEED Error {response.status_code}: {response.json()}"
+                        error_msg = f"Unknown SEED Error {response.status_code}: {body}"
                 except ValueError:
                     error_msg = "Unknown SEED Error: No response returned"
             if args:
@@ -294,12 +338,12 @@ class SEEDBaseClient(JSONAPI):
         response_content_types = response.headers.get("Content-Type", [])
 
         # pass through for spreadsheet (?)
-        if "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet" in response_content_types:
+        if _XLSX_CONTENT_TYPE in response_content_types:
             return response.content
         if "application/json" not in response_content_types:
             return {"status": "success", "content": response.content}
         if not data_name:
-            url = response.request.url
+            url = str(response.request.url)
             # take the last part of the url unless it's a digit
             # in which case take the previous part
             durl = url.lstrip(self.base_url).rstrip("/").rsplit("/", 1)
@@ -307,7 +351,7 @@ class SEEDBaseClient(JSONAPI):
         # actual results should be under data_name or the fallbacks
         # handle a 204
         result = None
-        result = {"status": "success"} if response.status_code == 204 else response.json()
+        result = {"status": "success"} if response.status_code == 204 else _decode_json(response)
         if result is None:
             error_msg = "No results returned"
             self._raise_error(response, error_msg, stack_pos=2, **kwargs)
@@ -355,7 +399,7 @@ class SEEDBaseClient(JSONAPI):
         :type stack_pos: integer
         """
         status_code = response.status_code
-        url = response.request.url
+        url = str(response.request.url)
         verb = response.request.method
         # e.g., MyClass.method
         caller = f"{self.__class__.__name__}.{inspect.stack()[stack_pos + 1][3]}"
@@ -385,12 +429,22 @@ class CreateMixin:
         :param endpoint: endpoint name.
         :param url: url to call
         :param data_name: key response data is stored under
-
-        :returns: dict (from response.json()[data_name])
+        :param chunk_size: send the json array in calls of at most chunk_size records,
+            for endpoints that accept arrays, e.g., meter readings
+        :param stream: return the checked response, with the body not yet downloaded,
+            rather than its result, e.g., to save large files as they arrive
+        :param compress: send the json body gzipped, for servers that decompress request bodies
+
+        :returns: dict (from response.json()[data_name]), or the joined lists
+            of each call when sent in chunks, results of calls that are not lists
+            are added as items
         """
         # for a post, if the user has sent some url args, then pop them for later
         # parsing.
         url_args = kwargs.pop("url_args", None)
+        chunk_size = kwargs.pop("chunk_size", None)
+        stream = kwargs.pop("stream", False)
+        compress = kwargs.pop("compress", False)
         kwargs = self._set_params(kwargs)
         endpoint = _set_default(self, "endpoint", endpoint)
         data_name = _set_default(self, "data_name", data_name, required=False)
@@ -404,7 +458,29 @@ class CreateMixin:
         if not url.endswith("/"):
             url = url + "/"
         url = _replace_url_args(url, url_args)
-        response = super()._post(url=url, **kwargs)
+        if chunk_size:
+            if "json" not in kwargs:
+                raise ValueError("chunk_size requires the records to be sent as a json array")
+            result = []
+            for response in super()._bulk_post(url=url, records=kwargs.pop("json"), chunk_size=chunk_size, compress=compress, **kwargs):
+                self._check_response(response, **kwargs)
+                chunk_result = self._get_result(response, data_name=data_name, **kwargs)
+                # endpoints may return a summary of each call rather than the created records
+                if isinstance(chunk_result, list):
+                    result.extend(chunk_result)
+                else:
+                    result.append(chunk_result)
+            return result
+        response = super()._post(url=url, stream=stream, compress=compress, **kwargs)
+        if stream:
+            content_type = response.headers.get("Content-Type", "")
+            if not (self.check_call_success(response) and any(file_type in content_type for file_type in _FILE_CONTENT_TYPES)):
+                # anything but a file, e.g., an error, is read in full so that it can be
+                # checked, which also releases the connection
+                with closing(response):
+                    _read_body(response)
+            self._check_response(response, **kwargs)
+            return response
         self._check_response(response, **kwargs)
         return self._get_result(response, data_name=data_name, **kwargs)
 
@@ -116,6 +116,14 @@ def read_map_file(mapfile_path):
         # Open the mapping file and fill list
         maplist = []
         for rowitem in map_reader:
+            if not rowitem:
+                # csv.reader returns an empty row for a blank line
+                continue
+            # fail before any of the mappings are sent to SEED
+            if len(rowitem) < 4:
+                raise ValueError(
+                    f"Line {map_reader.line_num} of mapping file {mapfile_path} has {len(rowitem)} values, expected at least 4",
+                )
             data = {
                 "from_field": rowitem[0],
                 "from_units": rowitem[1],
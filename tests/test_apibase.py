@@ -5,12 +5,22 @@ copyright (c) 2016-2016 Earth Advantage. All rights reserved.
 Unit tests for pyseed/apibase
 """
 
+import asyncio
+import base64
+import gzip
+import io
+import json
+import os
+import sys
+import tempfile
+import time
 import unittest
 from unittest import mock
 
 import pytest
+from requests.auth import HTTPBasicAuth, HTTPDigestAuth
 
-from pyseed.apibase import JSONAPI, BaseAPI, add_pk
+from pyseed.apibase import JSONAPI, BaseAPI, OAuthMixin, UserAuthMixin, _get_token_expiry, _normalize_url, add_pk
 from pyseed.exceptions import APIClientError
 from pyseed.seed_client_base import _get_urls, _set_default
 
@@ -63,17 +73,22 @@ class APITests(unittest.TestCase):
         # test defaults to https
         api = JSONAPI("example.org")
         api._get()
-        mock_requests.get.assert_called_with("https://example.org", timeout=None, headers=None)
+        mock_requests.Session.return_value.get.assert_called_with("https://example.org", timeout=None, headers=None)
 
         # use_ssl is False
         api = JSONAPI("example.org", use_ssl=False)
         api._get()
-        mock_requests.get.assert_called_with("http://example.org", timeout=None, headers=None)
+        mock_requests.Session.return_value.get.assert_called_with("http://example.org", timeout=None, headers=None)
 
     def test_get(self, mock_requests):
         """Test _get method."""
         self.api._get(id=1, foo="bar")
-        mock_requests.get.assert_called_with("https://example.org", params={"id": 1, "foo": "bar"}, timeout=None, headers=None)
+        mock_requests.Session.return_value.get.assert_called_with(
+            "https://example.org",
+            params={"id": 1, "foo": "bar"},
+            timeout=None,
+            headers=None,
+        )
 
     def test_post(self, mock_requests):
         """Test _get_post."""
@@ -81,12 +96,41 @@ class APITests(unittest.TestCase):
         files = {"file": "mock_file"}
         data = {"foo": "bar", "test": "test"}
         self.api._post(params=params, files=files, foo="bar", test="test")
-        mock_requests.post.assert_called_with("https://example.org", params=params, files=files, json=data, timeout=None, headers=None)
+        mock_requests.Session.return_value.post.assert_called_with(
+            "https://example.org",
+            params={**params, **data},
+            files=files,
+            json=data,
+            timeout=None,
+            headers=None,
+        )
+        # the caller's params are not modified
+        assert params == {"id": 1}
 
         # Not json
         api = BaseAPI("example.org")
         api._post(params=params, files=files, foo="bar", test="test")
-        mock_requests.post.assert_called_with("https://example.org", params=params, files=files, data=data, timeout=None, headers=None)
+        mock_requests.Session.return_value.post.assert_called_with(
+            "https://example.org",
+            params={**params, **data},
+            files=files,
+            data=data,
+            timeout=None,
+            headers=None,
+        )
+
+    def test_put(self, mock_requests):
+        """Test _put."""
+        params = {"id": 1}
+        data = {"foo": "bar"}
+        self.api._put(params=params, json=data, test="test")
+        mock_requests.Session.return_value.put.assert_called_with(
+            "https://example.org",
+            params={"id": 1, "test": "test"},
+            json=data,
+            timeout=None,
+            headers=None,
+        )
 
     def test_patch(self, mock_requests):
         """Test _get_patch."""
@@ -94,17 +138,36 @@ class APITests(unittest.TestCase):
         files = {"file": "mock_file"}
         data = {"foo": "bar", "test": "test"}
         self.api._patch(params=params, files=files, foo="bar", test="test")
-        mock_requests.patch.assert_called_with("https://example.org", params=params, files=files, json=data, timeout=None, headers=None)
+        mock_requests.Session.return_value.patch.assert_called_with(
+            "https://example.org",
+            params={**params, **data},
+            files=files,
+            json=data,
+            timeout=None,
+            headers=None,
+        )
 
         # Not json
         api = BaseAPI("example.org")
         api._patch(params=params, files=files, foo="bar", test="test")
-        mock_requests.patch.assert_called_with("https://example.org", params=params, files=files, data=data, timeout=None, headers=None)
+        mock_requests.Session.return_value.patch.assert_called_with(
+            "https://example.org",
+            params={**params, **data},
+            files=files,
+            data=data,
+            timeout=None,
+            headers=None,
+        )
 
     def test_delete(self, mock_requests):
         """Test _delete method."""
         self.api._delete(id=1, foo="bar")
-        mock_requests.delete.assert_called_with("https://example.org", params={"id": 1, "foo": "bar"}, timeout=None, headers=None)
+        mock_requests.Session.return_value.delete.assert_called_with(
+            "https://example.org",
+            params={"id": 1, "foo": "bar"},
+            timeout=None,
+            headers=None,
+        )
 
     def test_construct_payload(self, mock_requests):
         """Test construct_payload  method."""
@@ -112,7 +175,7 @@ class APITests(unittest.TestCase):
         with pytest.raises(APIClientError):
             api._get(foo="bar")
         api._get(id=1)
-        assert mock_requests.get.called
+        assert mock_requests.Session.return_value.get.called
 
         url = self.url
 
@@ -131,17 +194,217 @@ class APITests(unittest.TestCase):
             api._get()
         assert conm.value.error == "id is a compulsory field"
         api._get(id=1)
-        assert mock_requests.get.called
+        assert mock_requests.Session.return_value.get.called
 
     def test_check_call_success(self, mock_requests):
         """Test check_call_success method."""
         mock_response = mock.MagicMock()
         mock_response.status_code = 200
-        mock_requests.get.return_value = mock_response
-        mock_requests.codes.ok = 200
+        mock_requests.Session.return_value.get.return_value = mock_response
         response = self.api._get(id=1)
         assert self.api.check_call_success(response)
 
+        # SEED returns 201 or 204 for some writes
+        mock_response.status_code = 204
+        assert BaseAPI.check_call_success(mock_response)
+        mock_response.status_code = 404
+        assert not self.api.check_call_success(mock_response)
+
+    def test_session(self, mock_requests):
+        """Test a single session is reused and closed."""
+        self.api._get(id=1)
+        self.api._post(foo="bar")
+        mock_requests.Session.assert_called_once_with()
+        assert self.api.session is mock_requests.Session.return_value
+        adapter = mock_requests.Session.return_value.mount.call_args[0][1]
+        assert adapter._pool_maxsize == 50
+        assert adapter.max_retries.status_forcelist == (429, 502, 503, 504)
+        assert "POST" not in adapter.max_retries.allowed_methods
+
+        with self.api as api:
+            api._delete(id=1)
+        mock_requests.Session.return_value.close.assert_called_once_with()
+
+        # a supplied session is used as is
+        session = mock.MagicMock()
+        api = JSONAPI(self.url, session=session)
+        api._get(id=1)
+        session.get.assert_called_with("https://example.org", params={"id": 1}, timeout=None, headers=None)
+
+    def test_httpx_backend(self, mock_requests):
+        """Test the httpx backend converts requests style arguments."""
+        mock_httpx = mock.MagicMock()
+        client = mock_httpx.Client.return_value
+        with mock.patch.dict(sys.modules, {"httpx": mock_httpx}):
+            api = JSONAPI(self.url, backend="httpx", use_auth=True, auth=HTTPBasicAuth("user", "pass"))
+            api._get(id=1)
+            api._put(body=b"{}")
+        assert mock_httpx.HTTPTransport.call_args[1]["http2"]
+        mock_httpx.Client.assert_called_once_with(transport=mock_httpx.HTTPTransport.return_value, follow_redirects=True)
+        mock_requests.Session.assert_not_called()
+        client.build_request.assert_any_call("GET", "https://example.org", params={"id": 1}, timeout=None, headers=None)
+        client.send.assert_any_call(client.build_request.return_value, auth=("user", "pass"), stream=False)
+        assert client.build_request.call_args[0][0] == "PUT"
+
+        # file like bodies are streamed in chunks
+        with mock.patch.dict(sys.modules, {"httpx": mock_httpx}):
+            body = io.BytesIO(b"x" * 100_000)
+            body.len = 100_000
+            api._post(params={"headers": {"Content-Type": "multipart/form-data"}}, data=body, stream=True)
+        kwargs = client.build_request.call_args[1]
+        assert kwargs["headers"] == {"Content-Type": "multipart/form-data", "Content-Length": "100000"}
+        assert [len(chunk) for chunk in kwargs["content"]] == [65536, 34464]
+        assert client.send.call_args[1]["stream"]
+
+        # idempotent calls are retried when SEED is busy, POSTs are not
+        busy = mock.MagicMock(status_code=503, headers={"Retry-After": "0"})
+        ok = mock.MagicMock(status_code=200)
+        client.send.reset_mock()
+        client.send.side_effect = [busy, ok]
+        assert api._get(id=1) is ok
+        assert client.send.call_count == 2
+        busy.close.assert_called_once_with()
+        client.send.side_effect = [busy, ok]
+        assert api._post(foo="bar") is busy
+        client.send.side_effect = None
+
+        api.close()
+        client.close.assert_called_once_with()
+
+        with mock.patch.dict(sys.modules, {"httpx": None}), pytest.raises(APIClientError):
+            JSONAPI(self.url, backend="httpx")._get(id=1)
+
+    def test_async_calls(self, mock_requests):
+        """Test calls made from several threads at once share the session."""
+
+        async def fan_out():
+            return await asyncio.gather(
+                asyncio.to_thread(self.api._get, id=1),
+                asyncio.to_thread(self.api._get, id=2),
+                asyncio.to_thread(self.api._post, foo="bar"),
+            )
+
+        responses = asyncio.run(fan_out())
+        session = mock_requests.Session.return_value
+        assert responses == [session.get.return_value, session.get.return_value, session.post.return_value]
+        mock_requests.Session.assert_called_once_with()
+        assert session.get.call_count == 2
+        session.post.assert_called_with("https://example.org", params={"foo": "bar"}, json={"foo": "bar"}, timeout=None, headers=None)
+
+    def test_json_encoder(self, mock_requests):
+        """Test json bodies serialized outside of requests are sent as data."""
+        session = mock_requests.Session.return_value
+        json_headers = {"Content-Type": "application/json"}
+
+        # already serialized
+        self.api._put(json=b'{"foo": "bar"}')
+        session.put.assert_called_with("https://example.org", params={}, data=b'{"foo": "bar"}', timeout=None, headers=json_headers)
+
+        api = JSONAPI(self.url, json_encoder=lambda body: json.dumps(body).encode())
+        api._post(params={"id": 1}, json={"foo": "bar"})
+        session.post.assert_called_with("https://example.org", params={"id": 1}, data=b'{"foo": "bar"}', timeout=None, headers=json_headers)
+
+        # not used for multipart uploads
+        files = {"file": "mock_file"}
+        api._post(files=files, json={"foo": "bar"})
+        session.post.assert_called_with("https://example.org", params={}, files=files, json={"foo": "bar"}, timeout=None, headers=None)
+
+    def test_compressed_body(self, mock_requests):
+        """Test json bodies are gzipped on request."""
+        session = mock_requests.Session.return_value
+        self.api._post(json=[{"reading": 1}] * 3, compress=True)
+        kwargs = session.post.call_args[1]
+        assert kwargs["headers"] == {"Content-Type": "application/json", "Content-Encoding": "gzip"}
+        assert json.loads(gzip.decompress(kwargs["data"])) == [{"reading": 1}] * 3
+
+        api = JSONAPI(self.url, json_encoder=lambda body: json.dumps(body).encode())
+        api._post(json={"foo": "bar"}, compress=True)
+        assert gzip.decompress(session.post.call_args[1]["data"]) == b'{"foo": "bar"}'
+
+    def test_streamed_body(self, mock_requests):
+        """Test file-like bodies are sent as is."""
+        body = io.BytesIO(b"data")
+        self.api._post(params={"id": 1, "headers": {"Content-Type": "multipart/form-data"}}, data=body)
+        mock_requests.Session.return_value.post.assert_called_with(
+            "https://example.org",
+            params={"id": 1},
+            data=body,
+            timeout=None,
+            headers={"Content-Type": "multipart/form-data"},
+        )
+
+    def test_bulk_post(self, mock_requests):
+        """Test records are sent in chunks."""
+        records = [{"id": i} for i in range(5)]
+        responses = self.api._bulk_post(params={"cycle": 1}, records=records, chunk_size=2)
+        session = mock_requests.Session.return_value
+        # each chunk is sent once its response is taken
+        session.post.assert_not_called()
+        assert next(responses) is session.post.return_value
+        assert session.post.call_count == 1
+        assert len(list(responses)) == 2
+        assert session.post.call_count == 3
+        session.post.assert_called_with("https://example.org", params={"cycle": 1}, json=[{"id": 4}], timeout=None, headers=None)
+
+        # nothing to send
+        assert list(self.api._bulk_post(records=[])) == []
+        assert session.post.call_count == 3
+
+        # arrays cannot be sent as form data
+        with pytest.raises(APIClientError):
+            BaseAPI(self.url)._bulk_post(records=records)
+
+    def test_get_cache(self, mock_requests):
+        """Test GET responses are cached when cache_ttl is set."""
+        session = mock_requests.Session.return_value
+        session.get.return_value.status_code = 200
+
+        # no caching by default
+        self.api._get(id=1)
+        self.api._get(id=1)
+        assert session.get.call_count == 2
+
+        session.get.reset_mock()
+        api = JSONAPI(self.url, cache_ttl=60, cache_max_entries=2)
+        assert api._get(id=1) is api._get(id=1)
+        assert session.get.call_count == 1
+
+        # different params are cached separately, oldest entry is evicted
+        api._get(id=2)
+        api._get(id=3)
+        api._get(id=1)
+        assert session.get.call_count == 4
+
+        # writes clear the cache
+        api._post(foo="bar")
+        api._get(id=1)
+        assert session.get.call_count == 5
+
+        # errors are not cached
+        session.get.return_value.status_code = 500
+        api._get(id=4)
+        api._get(id=4)
+        assert session.get.call_count == 7
+
+    def test_conditional_get(self, mock_requests):
+        """Test GET responses are revalidated with their ETag."""
+        session = mock_requests.Session.return_value
+        first = mock.MagicMock(status_code=200, headers={"ETag": '"abc"'})
+        not_modified = mock.MagicMock(status_code=304, headers={})
+        session.get.side_effect = [first, not_modified]
+
+        api = JSONAPI(self.url, conditional_get=True)
+        assert api._get(id=1) is first
+        assert api._get(id=1) is first
+        session.get.assert_called_with("https://example.org", params={"id": 1}, timeout=None, headers={"If-None-Match": '"abc"'})
+
+        # responses without validators are not kept
+        session.get.side_effect = None
+        session.get.return_value = mock.MagicMock(status_code=200, headers={})
+        api._get(id=2)
+        api._get(id=2)
+        session.get.assert_called_with("https://example.org", params={"id": 2}, timeout=None, headers=None)
+
     def test_construct_url(self, mock_requests):  # noqa: ARG002
         """Test _construct_url method."""
         api = BaseAPI(use_ssl=False)
@@ -201,7 +464,12 @@ class APITestsNoURL(unittest.TestCase):
     def test_get(self, mock_requests):
         """Test _get method."""
         self.api._get(self.url, id=1, foo="bar")
-        mock_requests.get.assert_called_with("https://example.org", params={"id": 1, "foo": "bar"}, timeout=None, headers=None)
+        mock_requests.Session.return_value.get.assert_called_with(
+            "https://example.org",
+            params={"id": 1, "foo": "bar"},
+            timeout=None,
+            headers=None,
+        )
 
         # ensure error is raised if https is supplied and use_ssl is false
         api = BaseAPI("example.org", use_ssl=False)
@@ -221,12 +489,12 @@ class APITestsNoURL(unittest.TestCase):
 
         # test defaults to http
         self.api._get(url=self.url)
-        mock_requests.get.assert_called_with("https://example.org", timeout=None, headers=None)
+        mock_requests.Session.return_value.get.assert_called_with("https://example.org", timeout=None, headers=None)
 
         # use_ssl is False
         api = BaseAPI("example.org", use_ssl=False)
         api._get(url=self.url, use_ssl=False)
-        mock_requests.get.assert_called_with("http://example.org", timeout=None, headers=None)
+        mock_requests.Session.return_value.get.assert_called_with("http://example.org", timeout=None, headers=None)
 
     def test_post(self, mock_requests):
         """Test _get_post."""
@@ -234,12 +502,26 @@ class APITestsNoURL(unittest.TestCase):
         files = {"file": "mock_file"}
         data = {"foo": "bar", "test": "test"}
         self.api._post(url=self.url, params=params, files=files, foo="bar", test="test")
-        mock_requests.post.assert_called_with("https://example.org", params=params, files=files, json=data, timeout=None, headers=None)
+        mock_requests.Session.return_value.post.assert_called_with(
+            "https://example.org",
+            params={**params, **data},
+            files=files,
+            json=data,
+            timeout=None,
+            headers=None,
+        )
 
         # Not json
         api = BaseAPI()
         api._post(url=self.url, params=params, files=files, foo="bar", test="test")
-        mock_requests.post.assert_called_with("https://example.org", params=params, files=files, data=data, timeout=None, headers=None)
+        mock_requests.Session.return_value.post.assert_called_with(
+            "https://example.org",
+            params={**params, **data},
+            files=files,
+            data=data,
+            timeout=None,
+            headers=None,
+        )
 
         # ensure error is raised if no url  is supplied
         with pytest.raises(APIClientError) as conm:
@@ -263,12 +545,26 @@ class APITestsNoURL(unittest.TestCase):
         files = {"file": "mock_file"}
         data = {"foo": "bar", "test": "test"}
         self.api._patch(url=self.url, params=params, files=files, foo="bar", test="test")
-        mock_requests.patch.assert_called_with("https://example.org", params=params, files=files, json=data, timeout=None, headers=None)
+        mock_requests.Session.return_value.patch.assert_called_with(
+            "https://example.org",
+            params={**params, **data},
+            files=files,
+            json=data,
+            timeout=None,
+            headers=None,
+        )
 
         # Not json
         api = BaseAPI("example.org")
         api._patch(url=self.url, params=params, files=files, foo="bar", test="test")
-        mock_requests.patch.assert_called_with("https://example.org", params=params, files=files, data=data, timeout=None, headers=None)
+        mock_requests.Session.return_value.patch.assert_called_with(
+            "https://example.org",
+            params={**params, **data},
+            files=files,
+            data=data,
+            timeout=None,
+            headers=None,
+        )
 
         # ensure error is raised if no url  is supplied
         with pytest.raises(APIClientError) as conm:
@@ -289,7 +585,12 @@ class APITestsNoURL(unittest.TestCase):
     def test_delete(self, mock_requests):
         """Test _delete method."""
         self.api._delete(url=self.url, id=1, foo="bar")
-        mock_requests.delete.assert_called_with("https://example.org", params={"id": 1, "foo": "bar"}, timeout=None, headers=None)
+        mock_requests.Session.return_value.delete.assert_called_with(
+            "https://example.org",
+            params={"id": 1, "foo": "bar"},
+            timeout=None,
+            headers=None,
+        )
 
         # ensure error is raised if https is supplied and use_ssl is false
         api = BaseAPI("example.org", use_ssl=False)
@@ -309,12 +610,85 @@ class APITestsNoURL(unittest.TestCase):
 
         # test defaults to http
         self.api._delete(url=self.url)
-        mock_requests.delete.assert_called_with("https://example.org", timeout=None, headers=None)
+        mock_requests.Session.return_value.delete.assert_called_with("https://example.org", timeout=None, headers=None)
 
         # use_ssl is False
         api = BaseAPI("example.org", use_ssl=False)
         api._delete(url=self.url, use_ssl=False)
-        mock_requests.delete.assert_called_with("http://example.org", timeout=None, headers=None)
+        mock_requests.Session.return_value.delete.assert_called_with("http://example.org", timeout=None, headers=None)
+
+
+class UserAuthMixinTests(unittest.TestCase):
+    """Tests for UserAuthMixin"""
+
+    # pylint: disable=protected-access
+
+    def test_get_auth(self):
+        """Test basic or digest auth is built from the credentials"""
+
+        class UserAuthAPI(UserAuthMixin, JSONAPI):
+            """test class"""
+
+        api = UserAuthAPI("example.org", use_auth=True, username="test@example.org", api_key="dfghjk")
+        api._construct_payload({})
+        assert api.auth == HTTPBasicAuth("test@example.org", "dfghjk")
+
+        api = UserAuthAPI("example.org", use_auth=True, username="test@example.org", password="pw", auth_method="digest")
+        auth = api._get_auth()
+        assert isinstance(auth, HTTPDigestAuth)
+        assert (auth.username, auth.password) == ("test@example.org", "pw")
+
+
+def make_jwt(exp):
+    """Create an (unsigned) JWT with the given expiry"""
+    claims = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).decode().rstrip("=")
+    return f"header.{claims}.signature"
+
+
+class OAuthMixinTests(unittest.TestCase):
+    """Tests for OAuthMixin"""
+
+    # pylint: disable=protected-access
+
+    def setUp(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".pem", delete=False) as pk_file:
+            pk_file.write("private key")
+        self.addCleanup(os.remove, pk_file.name)
+        self.oauth_client = mock.MagicMock()
+
+        class OAuthAPI(OAuthMixin, JSONAPI):
+            """test class"""
+
+        self.api = OAuthAPI("example.org", private_key_location=pk_file.name, username="test@example.org", oauth_client=self.oauth_client)
+
+    def test_access_token_reused(self):
+        """Test the access token is only fetched again when about to expire"""
+        token = make_jwt(time.time() + 3600)
+        self.oauth_client.return_value.get_access_token.return_value = token
+        assert self.api._get_access_token() == token
+        assert self.api._get_access_token() == token
+        self.oauth_client.assert_called_once_with("private key", "test@example.org", None, pvt_key_password=None)
+        assert self.oauth_client.return_value.get_access_token.call_count == 1
+
+        # expiring tokens are refreshed, the private key is not read again
+        self.api._access_token_expiry = time.time() + 10
+        assert self.api._get_access_token() == token
+        assert self.oauth_client.call_count == 1
+        assert self.oauth_client.return_value.get_access_token.call_count == 2
+
+    def test_construct_payload(self):
+        """Test the access token is added to any headers, including none"""
+        self.oauth_client.return_value.get_access_token.return_value = "token"
+        for headers in (None, {}):
+            assert self.api._construct_payload({"headers": headers})["headers"] == {"Authorization": "Bearer token"}
+        params = self.api._construct_payload({"headers": {"Accept": "text/csv"}})
+        assert params["headers"] == {"Accept": "text/csv", "Authorization": "Bearer token"}
+
+    def test_get_token_expiry(self):
+        """Test the expiry is read from JWTs"""
+        assert _get_token_expiry(make_jwt(1234)) == 1234
+        assert _get_token_expiry("not a jwt") == 0
+        assert _get_token_expiry(None) == 0
 
 
 class APIFunctionTest(unittest.TestCase):
@@ -337,6 +711,10 @@ class APIFunctionTest(unittest.TestCase):
             add_pk("url", -1)
         assert conm.value.args[0] == "id/pk must be a positive integer"
 
+        with pytest.raises(TypeError) as conm:
+            add_pk("url", "-1")
+        assert conm.value.args[0] == "id/pk must be a positive integer"
+
         # adds ints
         result = add_pk("url", 1)
         assert result == "url/1"
@@ -357,6 +735,27 @@ class APIFunctionTest(unittest.TestCase):
         result = add_pk("url/", 1)
         assert result == "url/1"
 
+        result = add_pk("url/", "1", slash=True)
+        assert result == "url/1/"
+
+    def test_api_client_error_str(self):
+        """Test APIClientError message formatting"""
+        error = APIClientError("No llama!", service="SEED", url="https://example.org", caller="Test.get", verb="get", status_code=404, pk=1)
+        assert str(error) == (
+            "APIClientError: No llama!, calling service SEED as Test.get with url https://example.org, "
+            "http method: GET supplied with pk=1 http status code: 404"
+        )
+        assert str(APIClientError("No llama!")) == "APIClientError: No llama!"
+
+    def test_normalize_url(self):
+        """Test _normalize_url sets the scheme and caches results"""
+        _normalize_url.cache_clear()
+        assert _normalize_url("example.org/api", True) == "https://example.org/api"
+        assert _normalize_url("https://example.org/api", True) == "https://example.org/api"
+        assert _normalize_url("http://example.org/api", False) == "http://example.org/api"
+        assert _normalize_url("example.org/api", True) == "https://example.org/api"
+        assert _normalize_url.cache_info().hits == 1
+
     def test_set_default(self):
         """Test _set_default helper method"""
         obj = mock.MagicMock()
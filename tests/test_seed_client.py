@@ -3,14 +3,21 @@ SEED Platform (TM), Copyright (c) Alliance for Sustainable Energy, LLC, and othe
 See also https://github.com/seed-platform/py-seed/main/LICENSE
 """
 
+import asyncio
 import os
+import tempfile
+import threading
 import unittest
 from datetime import date
 from pathlib import Path
+from unittest import mock
 
 import pytest
+import requests
 
-from pyseed.seed_client import SeedClient
+from pyseed.exceptions import SEEDError
+from pyseed.seed_client import SeedClient, _RewindableMultipartEncoder
+from pyseed.utils import read_map_file
 
 # For CI the test org is 1, but for local testing it may be different
 ORGANIZATION_ID = 1
@@ -459,3 +466,929 @@ class SeedClientMultiCycleTest(unittest.TestCase):
         assert building_cycles[0]["site_eui"] == 95
         assert building_cycles[1]["site_eui"] == 181
         assert building_cycles[2]["site_eui"] == 129
+
+
+class SeedClientUnitTest(unittest.TestCase):
+    """Tests of the helper methods with the SEED api mocked out."""
+
+    def setUp(self):
+        connection_params = {
+            "name": "unit test",
+            "base_url": "http://127.0.0.1",
+            "username": "user@seed-platform.org",
+            "api_key": "fake",
+            "port": 8000,
+            "use_ssl": False,
+        }
+        self.seed_client = SeedClient(ORGANIZATION_ID, connection_params=connection_params)
+        self.seed_client.client = mock.MagicMock()
+
+    def test_track_many(self):
+        def progress(*_args, url_args=None, **_kwargs):
+            key = url_args["PROGRESS_KEY"]
+            calls[key] = calls.get(key, 0) + 1
+            return {"progress_key": key, "progress": 100 if calls[key] > 1 else 50}
+
+        calls = {}
+        self.seed_client.client.get.side_effect = progress
+        results = asyncio.run(self.seed_client.track_many(["a", "b"], interval=0.01))
+        assert [result["progress_key"] for result in results] == ["a", "b"]
+        assert calls == {"a": 2, "b": 2}
+
+        # finished keys are not checked again
+        calls = {"a": 1}
+        results = asyncio.run(self.seed_client.track_progress_many(["a", "b", "a"], interval=0.01))
+        assert set(results) == {"a", "b"}
+        assert calls == {"a": 2, "b": 2}
+
+        with pytest.raises(Exception, match="No progress key provided"):
+            asyncio.run(self.seed_client.track_progress_many(["a", None]))
+
+        # the keys whose progress cannot be retrieved are reported
+        def failing(*_args, url_args=None, **_kwargs):
+            key = url_args["PROGRESS_KEY"]
+            if key == "b":
+                raise requests.ConnectionError("connection refused")
+            return {"progress_key": key, "progress": 50}
+
+        self.seed_client.client.get.side_effect = failing
+        with pytest.raises(Exception, match="Could not get the progress of b after 3 attempts"):
+            asyncio.run(self.seed_client.track_many(["a", "b"], interval=0, max_failures=3))
+
+        # unless asked to give up, failures are checked through
+        self.seed_client.client.get.side_effect = [SEEDError("bad gateway", status_code=502)] * 20 + [{"progress": 100}]
+        assert asyncio.run(self.seed_client.track_many(["a"], interval=0)) == [{"progress": 100}]
+
+        # as are the keys not done in time
+        self.seed_client.client.get.side_effect = None
+        self.seed_client.client.get.return_value = {"progress": 50}
+        with pytest.raises(TimeoutError, match="Progress of a, b not done"):
+            asyncio.run(self.seed_client.track_progress_many(["a", "b"], interval=0, timeout=0.01))
+
+    def test_run_import_pipeline(self):
+        client = self.seed_client
+        client.get_or_create_dataset = mock.MagicMock(return_value={"id": 1})
+        client.create_or_update_column_mapping_profile_from_file = mock.MagicMock(return_value={"mappings": []})
+        client.upload_datafile = mock.MagicMock(side_effect=[{"import_file_id": 10}, {"import_file_id": 11}])
+        client.start_save_data = mock.MagicMock(return_value={"progress_key": "save"})
+        client.set_import_file_column_mappings = mock.MagicMock()
+        client.start_map_data = mock.MagicMock(return_value={"progress_key": "map"})
+        client.start_system_matching_and_geocoding = mock.MagicMock(return_value={"progress_data": {"progress_key": "match"}})
+        client.get_matching_results = mock.MagicMock(side_effect=lambda import_file_id: {"import_file_id": import_file_id})
+        client.client.get.return_value = {"progress": 100}
+
+        results = asyncio.run(client.run_import_pipeline("dataset", ["a.csv", "b.csv"], "profile", "mappings.csv"))
+        assert sorted(result["import_file_id"] for result in results) == [10, 11]
+        client.create_or_update_column_mapping_profile_from_file.assert_called_once_with("profile", "mappings.csv")
+        assert client.start_system_matching_and_geocoding.call_count == 2
+
+    def test_run_import_pipeline_meters_and_ingest_cache(self):
+        client = self.seed_client
+        client.client.base_url = "127.0.0.1:8000/"
+        client.client.org_id = ORGANIZATION_ID
+        client.cycle_id = 3
+        client.get_or_create_dataset = mock.MagicMock(return_value={"id": 1})
+        client.create_or_update_column_mapping_profile_from_file = mock.MagicMock(return_value={"mappings": []})
+        client.upload_datafile = mock.MagicMock(return_value={"import_file_id": 10})
+        client.start_save_data = mock.MagicMock(return_value={"progress_key": "save"})
+        client.set_import_file_column_mappings = mock.MagicMock()
+        client.start_map_data = mock.MagicMock(return_value={"progress_key": "map"})
+        client.start_system_matching_and_geocoding = mock.MagicMock(return_value={"progress_data": {"progress_key": "match"}})
+        client.get_matching_results = mock.MagicMock(return_value={"import_file_id": 10})
+        client.check_meters_tab_exist = mock.MagicMock(return_value=True)
+        client.import_files_reuse_inventory_file_for_meters = mock.MagicMock(return_value={"import_file_id": 11})
+        client.invalidate_meters_cache = mock.MagicMock()
+        client.client.get.return_value = {"progress": 100}
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client.INGEST_CACHE_DIR = Path(tmpdir) / "cache"
+            datafile = Path(tmpdir) / "data.csv"
+            mappings_file = Path(tmpdir) / "mappings.csv"
+            datafile.write_text("a,b\n1,2\n")
+            mappings_file.write_text("mappings")
+
+            for _ in range(2):
+                results = asyncio.run(
+                    client.run_import_pipeline(
+                        "dataset", [datafile], "profile", mappings_file, import_meters_if_exist=True, use_ingest_cache=True
+                    )
+                )
+                assert results == [{"import_file_id": 10}]
+            # the second run uses the summary of the first one
+            client.upload_datafile.assert_called_once()
+            client.start_save_data.assert_called_with(11)
+            client.invalidate_meters_cache.assert_called_once_with()
+
+    def test_upload_and_match_datafile(self):
+        client = self.seed_client
+        profile_created = threading.Event()
+
+        def create_profile(*_args):
+            profile_created.set()
+            return {"mappings": ["mapping"]}
+
+        def track_progress_result(progress_key):
+            # the profile is created while the data is being saved
+            if progress_key == "save":
+                assert profile_created.wait(5)
+            return {"progress": 100}
+
+        client.get_or_create_dataset = mock.MagicMock(return_value={"id": 1})
+        client.upload_datafile = mock.MagicMock(return_value={"import_file_id": 10})
+        client.start_save_data = mock.MagicMock(return_value={"progress_key": "save"})
+        client.create_or_update_column_mapping_profile_from_file = mock.MagicMock(side_effect=create_profile)
+        client.track_progress_result = mock.MagicMock(side_effect=track_progress_result)
+        client.set_import_file_column_mappings = mock.MagicMock()
+        client.start_map_data = mock.MagicMock(return_value={"progress_key": "map"})
+        client.start_system_matching_and_geocoding = mock.MagicMock(return_value={"progress_data": {"progress_key": "match"}})
+        client.get_matching_results = mock.MagicMock(return_value={"import_file_id": 10})
+
+        assert client.upload_and_match_datafile("dataset", "a.csv", "profile", "mappings.csv") == {"import_file_id": 10}
+        client.create_or_update_column_mapping_profile_from_file.assert_called_once_with("profile", "mappings.csv")
+        client.set_import_file_column_mappings.assert_called_once_with(10, ["mapping"])
+
+    def test_upload_and_match_datafile_ingest_cache(self):
+        client = self.seed_client
+        client.client.base_url = "127.0.0.1:8000/"
+        client.client.org_id = ORGANIZATION_ID
+        client.cycle_id = 3
+        client.get_or_create_dataset = mock.MagicMock(return_value={"id": 1})
+        client.upload_datafile = mock.MagicMock(return_value={"import_file_id": 10})
+        client.start_save_data = mock.MagicMock(return_value={"progress_key": "save"})
+        client.create_or_update_column_mapping_profile_from_file = mock.MagicMock(return_value={"mappings": []})
+        client.track_progress_result = mock.MagicMock(return_value={"progress": 100})
+        client.set_import_file_column_mappings = mock.MagicMock()
+        client.start_map_data = mock.MagicMock(return_value={"progress_key": "map"})
+        client.start_system_matching_and_geocoding = mock.MagicMock(return_value={"progress_data": {"progress_key": "match"}})
+        client.get_matching_results = mock.MagicMock(return_value={"import_file_id": 10})
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client.INGEST_CACHE_DIR = Path(tmpdir) / "cache"
+            datafile = Path(tmpdir) / "data.csv"
+            mappings_file = Path(tmpdir) / "mappings.csv"
+            datafile.write_text("a,b\n1,2\n")
+            mappings_file.write_text("mappings")
+
+            for _ in range(2):
+                result = client.upload_and_match_datafile("dataset", datafile, "profile", mappings_file, use_ingest_cache=True)
+                assert result == {"import_file_id": 10}
+            client.upload_datafile.assert_called_once()
+
+            # a changed datafile, or not using the cache, is ingested again
+            datafile.write_text("a,b\n1,3\n")
+            client.upload_and_match_datafile("dataset", datafile, "profile", mappings_file, use_ingest_cache=True)
+            client.upload_and_match_datafile("dataset", datafile, "profile", mappings_file)
+            assert client.upload_datafile.call_count == 3
+
+            # without a directory set, the summaries are kept in the home directory found at that time
+            client.INGEST_CACHE_DIR = None
+            with mock.patch("pyseed.seed_client.Path.home", return_value=Path(tmpdir)):
+                client.upload_and_match_datafile("dataset", datafile, "profile", mappings_file, use_ingest_cache=True)
+            assert len(list((Path(tmpdir) / ".seed_client_cache").iterdir())) == 1
+
+    def test_upload_and_match_datafile_async(self):
+        client = self.seed_client
+        client.get_or_create_dataset = mock.MagicMock(return_value={"id": 1})
+        client.upload_datafile = mock.MagicMock(return_value={"import_file_id": 10})
+        client.start_save_data = mock.MagicMock(side_effect=[{"progress_key": "save"}, {"progress_key": "meters"}])
+        client.create_or_update_column_mapping_profile_from_file = mock.MagicMock(return_value={"mappings": ["mapping"]})
+        client.set_import_file_column_mappings = mock.MagicMock()
+        client.start_map_data = mock.MagicMock(return_value={"progress_key": "map"})
+        client.start_system_matching_and_geocoding = mock.MagicMock(return_value={"progress_data": {"progress_key": "match"}})
+        client.get_matching_results = mock.MagicMock(return_value={"import_file_id": 10})
+        client.check_meters_tab_exist = mock.MagicMock(return_value=True)
+        client.import_files_reuse_inventory_file_for_meters = mock.MagicMock(return_value={"import_file_id": 11})
+        client.client.get.return_value = {"progress": 100}
+        client.invalidate_meters_cache = mock.MagicMock()
+
+        result = asyncio.run(
+            client.upload_and_match_datafile_async("dataset", "a.csv", "profile", "mappings.csv", import_meters_if_exist=True),
+        )
+        assert result == {"import_file_id": 10}
+        client.set_import_file_column_mappings.assert_called_once_with(10, ["mapping"])
+        client.start_save_data.assert_called_with(11)
+        # the imported meters are fetched again
+        client.invalidate_meters_cache.assert_called_once_with()
+
+    def test_context_manager(self):
+        with self.seed_client as seed_client:
+            assert seed_client is self.seed_client
+        self.seed_client.client.close.assert_called_once_with()
+
+        # a supplied session is shared with the underlying client
+        session = mock.MagicMock()
+        seed_client = SeedClient(ORGANIZATION_ID, connection_params={"base_url": "http://127.0.0.1"}, session=session)
+        assert seed_client.client.session is session
+
+    def test_update_labels_of_buildings_missing_labels(self):
+        client = self.seed_client.client
+        client.list.return_value = [{"id": 3, "name": "Violation"}, {"id": 16, "name": "Complied"}]
+        with self.assertLogs("pyseed.seed_client", level="WARNING") as logs:
+            self.seed_client.update_labels_of_buildings(["Complied", "Missing", "Violation"], ["Missing", "Violation"], [1])
+        # each missing label is reported once
+        assert logs.output == ["WARNING:pyseed.seed_client:label name Missing not found in SEED, skipping"]
+        assert client.put.call_args[1]["json"] == {"inventory_ids": [1], "add_label_ids": [16, 3], "remove_label_ids": [3]}
+
+    def test_labels_cache(self):
+        client = self.seed_client.client
+        client.org_id = ORGANIZATION_ID
+        client.list.return_value = [
+            {"id": 3, "name": "Violation", "organization_id": 1},
+            {"id": 16, "name": "Complied", "organization_id": 1},
+        ]
+        assert self.seed_client.get_labels(filter_by_name=["Complied"]) == [client.list.return_value[1]]
+        self.seed_client.update_labels_of_buildings(["Violation"], ["Complied"], [1, 2])
+        client.list.assert_called_once_with(endpoint="labels")
+        client.put.assert_called_once_with(
+            None,
+            required_pk=False,
+            endpoint="labels_property",
+            json={"inventory_ids": [1, 2], "add_label_ids": [3], "remove_label_ids": [16]},
+        )
+
+        # the cached labels are not changed by the caller
+        labels = self.seed_client.get_labels()
+        labels[0]["color"] = "red"
+        labels.pop()
+        assert self.seed_client.get_labels() == [
+            {"id": 3, "name": "Violation", "organization_id": 1},
+            {"id": 16, "name": "Complied", "organization_id": 1},
+        ]
+        assert client.list.call_count == 1
+
+        # changing a label refetches the labels and leaves the cached label as is
+        labels = self.seed_client.get_labels()
+        self.seed_client.update_label("Violation", new_color="red")
+        assert labels[0] == {"id": 3, "name": "Violation", "organization_id": 1}
+        self.seed_client.get_labels()
+        assert client.list.call_count == 2
+
+        # the lookup is kept per organization
+        client.org_id = ORGANIZATION_ID + 1
+        self.seed_client.get_labels()
+        assert client.list.call_count == 3
+
+        # deleting finds the label id in the cached labels
+        self.seed_client.delete_label("Complied")
+        client.delete.assert_called_once_with(16, endpoint="labels")
+        assert client.list.call_count == 3
+        with pytest.raises(Exception, match="Could not find label to delete"):
+            self.seed_client.delete_label("Missing")
+
+        # labels fetched while the labels are invalidated are not cached
+        def list_labels(**_kwargs):
+            self.seed_client.invalidate_labels_cache()
+            return [{"id": 3, "name": "Violation", "organization_id": 1}]
+
+        client.list.side_effect = list_labels
+        self.seed_client.invalidate_labels_cache()
+        self.seed_client.get_labels()
+        self.seed_client.get_labels()
+        assert client.list.call_count == 6
+
+    def test_get_view_ids_with_label(self):
+        client = self.seed_client.client
+        client.org_id = ORGANIZATION_ID
+        self.seed_client.cycle_id = 2
+        client.post.return_value = [{"id": 3, "name": "Violation", "is_applied": [11, 12]}]
+        assert self.seed_client.get_view_ids_with_label(["Violation", "Complied", "Violation"]) == client.post.return_value
+        client.post.assert_called_once_with(endpoint="properties_labels", cycle=2, json={"label_names": ["Complied", "Violation"]})
+
+        # the same names in another order are served from the cache, which the caller cannot change
+        view_ids = self.seed_client.get_view_ids_with_label(["Complied", "Violation"])
+        view_ids[0]["is_applied"].append(13)
+        view_ids.clear()
+        assert self.seed_client.get_view_ids_with_label(["Complied", "Violation"]) == [{"id": 3, "name": "Violation", "is_applied": [11, 12]}]
+        assert client.post.call_count == 1
+
+        # until labels are applied to buildings
+        client.list.return_value = [{"id": 3, "name": "Violation"}]
+        self.seed_client.update_labels_of_buildings(["Violation"], [], [11])
+        self.seed_client.get_view_ids_with_label(["Complied", "Violation"])
+        assert client.post.call_count == 2
+
+        # or buildings are updated
+        self.seed_client.update_building(11, params={"state": {}})
+        self.seed_client.get_view_ids_with_label(["Complied", "Violation"])
+        assert client.post.call_count == 3
+
+    def test_column_mapping_profiles(self):
+        client = self.seed_client.client
+        client.org_id = ORGANIZATION_ID
+        client.post.return_value = [
+            {"id": 1, "name": "Default", "profile_type": "Normal"},
+            {"id": 2, "name": "BuildingSync", "profile_type": "BuildingSync Default"},
+            {"id": 3, "name": "Default", "profile_type": "Normal"},
+        ]
+        assert [item["id"] for item in self.seed_client.get_column_mapping_profiles()] == [1, 2, 3]
+        assert [item["id"] for item in self.seed_client.get_column_mapping_profiles("Normal")] == [1, 3]
+        assert self.seed_client.get_column_mapping_profile("Default")["id"] == 1
+        assert self.seed_client.get_column_mapping_profile("Missing") is None
+        client.post.assert_called_once_with(endpoint="column_mapping_profiles_filter")
+
+        # the cached profiles are not changed by the caller
+        self.seed_client.get_column_mapping_profile("Default")["name"] = "changed"
+        self.seed_client.get_column_mapping_profiles().pop()
+        assert [item["name"] for item in self.seed_client.get_column_mapping_profiles()] == ["Default", "BuildingSync", "Default"]
+
+        # expired profiles are refetched
+        with mock.patch.object(SeedClient, "CACHE_TTL", 0):
+            self.seed_client.get_column_mapping_profile("Default")
+        assert client.post.call_count == 2
+
+    def test_get_or_create_cycle(self):
+        self.seed_client.get_cycles = mock.MagicMock(
+            return_value=[{"id": 1, "name": "2021"}, {"id": 2, "name": "2022"}, {"id": 3, "name": "2022"}],
+        )
+        self.seed_client.create_cycle = mock.MagicMock(return_value={"id": 4, "name": "2023"})
+
+        with self.assertLogs("pyseed.seed_client", level="WARNING"):
+            cycle = self.seed_client.get_or_create_cycle("2022", date(2022, 1, 1), date(2022, 12, 31), set_cycle_id=True)
+        assert cycle["id"] == 2
+        assert self.seed_client.cycle_id == 2
+
+        # duplicates of other cycle names are not reported
+        with mock.patch("pyseed.seed_client.logger") as mock_logger:
+            cycle = self.seed_client.get_or_create_cycle(2023, date(2023, 1, 1), date(2023, 12, 31))
+        mock_logger.warning.assert_not_called()
+        assert cycle["id"] == 4
+        self.seed_client.create_cycle.assert_called_once_with("2023", date(2023, 1, 1), date(2023, 12, 31))
+
+    def test_read_connection_config_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_file = Path(tmpdir) / "seed-config.json"
+            config_file.write_text('{"base_url": "http://127.0.0.1", "port": 8000}')
+            params = SeedClient.read_connection_config_file(str(config_file))
+            assert params == {"base_url": "http://127.0.0.1", "port": 8000}
+
+            # the parsed file is reused, but each caller gets its own params
+            params["port"] = 443
+            with mock.patch("pyseed.seed_client.json_loads") as mock_loads:
+                assert SeedClient.read_connection_config_file(config_file)["port"] == 8000
+            mock_loads.assert_not_called()
+
+            # until the file changes
+            config_file.write_text('{"base_url": "http://127.0.0.1", "port": 80}')
+            assert SeedClient.read_connection_config_file(config_file)["port"] == 80
+
+        with pytest.raises(Exception, match="Cannot find connection config file"):
+            SeedClient.read_connection_config_file(config_file)
+
+    def test_upload_datafile(self):
+        client = self.seed_client.client
+        with tempfile.TemporaryDirectory() as tmpdir:
+            data_file = Path(tmpdir) / "data.csv"
+            data_file.write_text("a,b\n1,2\n")
+            with mock.patch("pyseed.seed_client.MultipartEncoder", None):
+                self.seed_client.upload_datafile(1, str(data_file), "Assessed Raw")
+            files = client.post.call_args[1]["files"]
+            assert files[0][1][0] == "data.csv"
+            # the file is closed once uploaded
+            assert files[0][1][1].closed
+            client.post.assert_called_with("upload", params={"import_record": 1, "source_type": "Assessed Raw"}, files=files)
+
+    def test_retrieve_portfolio_manager_property(self):
+        client = self.seed_client.client
+        response = mock.MagicMock()
+        response.headers = {"Content-Type": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"}
+        response.iter_content.return_value = [b"xl", b"sx"]
+        client.post.return_value = response
+        with tempfile.TemporaryDirectory() as tmpdir:
+            save_file = Path(tmpdir) / "espm.xlsx"
+            assert self.seed_client.retrieve_portfolio_manager_property("user", "pass", 1, save_file) == {"status": "success"}
+            # the download is written as it arrives
+            assert save_file.read_bytes() == b"xlsx"
+        assert client.post.call_args[1]["stream"] is True
+        response.close.assert_called_once_with()
+
+    def test_download_pm_report(self):
+        from openpyxl import load_workbook
+
+        self.seed_client.client.post.return_value = {
+            "properties": [{"id": 1, "name": "A"}, {"id": 2, "name": "B", "city": "Golden"}],
+        }
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            os.chdir(tmpdir)
+            try:
+                with pytest.raises(KeyError):
+                    # every property must have every column
+                    self.seed_client.download_pm_report("user", "pass", {"name": "template"})
+                self.seed_client.client.post.return_value["properties"][0]["city"] = None
+                report = self.seed_client.download_pm_report("user", "pass", {"name": "template"})
+                assert report == os.path.join(tmpdir, "reports", "user_template.xlsx")
+                rows = list(load_workbook(report).active.values)
+            finally:
+                os.chdir(cwd)
+        assert rows == [("id", "name", "city"), (1, "A", None), (2, "B", "Golden")]
+
+    def test_import_portfolio_manager_property(self):
+        client = self.seed_client.client
+        with tempfile.TemporaryDirectory() as tmpdir:
+            espm_file = Path(tmpdir) / "espm.xlsx"
+            espm_file.write_bytes(b"xlsx")
+            # streamed with requests-toolbelt when it is installed
+            with mock.patch("pyseed.seed_client.MultipartEncoder") as mock_encoder:
+                self.seed_client.import_portfolio_manager_property(1, 2, 3, str(espm_file))
+            fields = mock_encoder.call_args[1]["fields"]
+            assert fields["file"][0] == "espm.xlsx"
+            assert fields["file"][1].closed
+            body = client.put.call_args[1]["data"]
+            assert isinstance(body, _RewindableMultipartEncoder)
+            client.put.assert_called_once_with(
+                None,
+                required_pk=False,
+                endpoint="property_update_with_espm",
+                url_args={"PK": 1},
+                cycle_id=2,
+                mapping_profile_id=3,
+                params={"headers": {"Content-Type": mock_encoder.return_value.content_type}},
+                data=body,
+            )
+
+    def test_rewindable_multipart_encoder(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            data_file = Path(tmpdir) / "espm.xlsx"
+            data_file.write_bytes(b"xlsx")
+            with open(data_file, "rb") as f, mock.patch("pyseed.seed_client.MultipartEncoder") as mock_encoder:
+                mock_encoder.return_value.read.return_value = b"body"
+                body = _RewindableMultipartEncoder("espm.xlsx", f)
+                assert body.len == mock_encoder.return_value.len
+                assert body.read(4) == b"body"
+                f.read()
+                assert body.tell() == 4
+
+                # a retried call resends the file from the start, under the same boundary
+                assert body.seek(0) == 0
+                assert body.tell() == 0
+                assert f.tell() == 0
+                mock_encoder.assert_called_with(
+                    fields={"file": ("espm.xlsx", f, "application/octet-stream")},
+                    boundary=mock_encoder.return_value.boundary_value,
+                )
+                with pytest.raises(OSError, match="only be rewound to its start"):
+                    body.seek(2)
+
+    def test_get_buildings(self):
+        def list_properties(page=None, per_page=None, **_kwargs):
+            results = [{"id": i} for i in range((page - 1) * per_page, min(page * per_page, 5))]
+            return {"pagination": {"num_pages": 3, "total": 5}, "results": results}
+
+        client = self.seed_client.client
+        client.list.side_effect = list_properties
+        self.seed_client.cycle_id = 1
+        buildings = self.seed_client.get_buildings(per_page=2)
+        assert [building["id"] for building in buildings] == [0, 1, 2, 3, 4]
+        assert client.list.call_count == 3
+
+        buildings = asyncio.run(self.seed_client.get_buildings_async(per_page=2))
+        assert [building["id"] for building in buildings] == [0, 1, 2, 3, 4]
+        assert client.list.call_count == 6
+        client.list.assert_any_call(endpoint="properties", data_name="all", per_page=2, page=1, cycle=1)
+
+    def test_create_or_update_column_mapping_profile(self):
+        client = self.seed_client.client
+        client.org_id = ORGANIZATION_ID
+        client.post.side_effect = [
+            [{"id": 1, "name": "Existing", "profile_type": "Normal", "mappings": []}],
+            {"id": 2, "name": "New", "profile_type": "Normal", "mappings": []},
+        ]
+        client.put.return_value = {"id": 1, "name": "Existing", "profile_type": "Normal", "mappings": [{"from_field": "a"}]}
+
+        self.seed_client.create_or_update_column_mapping_profile("Existing", [{"from_field": "a"}])
+        self.seed_client.create_or_update_column_mapping_profile("New", [])
+        assert self.seed_client.get_column_mapping_profile("Existing")["mappings"] == [{"from_field": "a"}]
+        assert self.seed_client.get_column_mapping_profile("New")["id"] == 2
+        assert [item["id"] for item in self.seed_client.get_column_mapping_profiles()] == [1, 2]
+        # only the first lookup fetched the profiles
+        assert client.post.call_count == 2
+
+    def test_get_or_create_dataset(self):
+        client = self.seed_client.client
+        client.org_id = ORGANIZATION_ID
+        client.list.return_value = [{"id": 1, "name": "existing"}]
+        client.post.return_value = {"status": "success", "id": 2}
+        client.get.return_value = {"id": 2, "name": "new"}
+
+        assert self.seed_client.get_or_create_dataset("existing")["id"] == 1
+        client.post.assert_not_called()
+        assert self.seed_client.get_or_create_dataset("new")["id"] == 2
+        client.post.assert_called_once_with(endpoint="datasets", json={"name": "new"})
+
+        # the datasets are listed once, and again after the dataset is created
+        client.list.return_value = [{"id": 1, "name": "existing"}, {"id": 2, "name": "new"}]
+        assert self.seed_client.get_or_create_dataset("existing")["id"] == 1
+        assert self.seed_client.get_or_create_dataset("new")["id"] == 2
+        assert client.list.call_count == 2
+        assert client.get.call_count == 1
+        client.post.assert_called_once()
+
+        # the cached datasets are not changed by the caller
+        self.seed_client.get_or_create_dataset("existing")["name"] = "changed"
+        assert self.seed_client.get_or_create_dataset("existing") == {"id": 1, "name": "existing"}
+
+        # expired results are refetched
+        with mock.patch.object(SeedClient, "CACHE_TTL", 0):
+            self.seed_client.get_or_create_dataset("existing")
+        assert client.list.call_count == 3
+
+    def test_update_labels_of_buildings_async(self):
+        client = self.seed_client.client
+        client.org_id = ORGANIZATION_ID
+        client.list.return_value = [{"id": 3, "name": "Violation"}]
+        client.put.return_value = {"status": "success"}
+
+        results = asyncio.run(self.seed_client.update_labels_of_buildings_async(["Violation"], [], list(range(5)), chunk_size=2))
+        assert len(results) == 3
+        client.list.assert_called_once_with(endpoint="labels")
+        sent = sorted(call[1]["json"]["inventory_ids"] for call in client.put.call_args_list)
+        assert sent == [[0, 1], [2, 3], [4]]
+
+        with pytest.raises(ValueError, match="inventory_type"):
+            asyncio.run(self.seed_client.update_labels_of_buildings_async(["Violation"], [], [1], inventory_type="bad"))
+
+    def test_set_import_file_column_mappings(self):
+        client = self.seed_client.client
+        client.org_id = 2
+        client.urls = {"org_column_mapping_import_file": "http://127.0.0.1:8000/api/v3/organizations/ORG_ID/column_mappings/"}
+        self.seed_client.set_import_file_column_mappings(5, [])
+        client.post.assert_called_with(
+            "http://127.0.0.1:8000/api/v3/organizations/2/column_mappings/",
+            params={"import_file_id": 5},
+            json={"mappings": []},
+        )
+
+        # a new organization gets its own url
+        client.org_id = 3
+        self.seed_client.set_import_file_column_mappings(5, [])
+        assert client.post.call_args[0][0] == "http://127.0.0.1:8000/api/v3/organizations/3/column_mappings/"
+
+    def test_track_progress_result(self):
+        client = self.seed_client.client
+        client.get.side_effect = [{"progress": 10}, requests.ConnectionError("connection reset"), {"progress": 100}]
+        with mock.patch("pyseed.seed_client.time.sleep") as mock_sleep:
+            assert self.seed_client.track_progress_result("key")["progress"] == 100
+        assert mock_sleep.call_count == 2
+
+        client.get.side_effect = None
+        client.get.return_value = {"progress": 10}
+        with pytest.raises(TimeoutError):
+            self.seed_client.track_progress_result("key", interval=0, timeout=0.01)
+
+        # waits grow up to max_interval
+        client.get.side_effect = [{"progress": 10}] * 4 + [{"progress": 100}]
+        with mock.patch("pyseed.seed_client.time.sleep") as mock_sleep:
+            self.seed_client.track_progress_result("key", interval=1, max_interval=2)
+        assert [call[0][0] for call in mock_sleep.call_args_list] == [1, 1.5, 2, 2]
+
+        # repeated failures are raised
+        client.get.reset_mock()
+        client.get.side_effect = requests.ConnectionError("connection refused")
+        with mock.patch("pyseed.seed_client.time.sleep"), pytest.raises(Exception, match="Could not get the progress"):
+            self.seed_client.track_progress_result("key", max_failures=3)
+        assert client.get.call_count == 3
+
+        # unless asked to give up, failures are checked through, e.g., while the server restarts
+        client.get.side_effect = [SEEDError("bad gateway", status_code=502)] * 20 + [{"progress": 100}]
+        with mock.patch("pyseed.seed_client.time.sleep"):
+            assert self.seed_client.track_progress_result("key")["progress"] == 100
+
+        # errors that will not go away are raised right away
+        for error in (SEEDError("Not found", status_code=404), ValueError("bad json")):
+            client.get.reset_mock()
+            client.get.side_effect = error
+            with mock.patch("pyseed.seed_client.time.sleep"), pytest.raises(type(error)):
+                self.seed_client.track_progress_result("key")
+            assert client.get.call_count == 1
+
+        # long polling passes the wait on to the server and still falls back to backing off
+        client.get.side_effect = [{"progress": 10}, {"progress": 100}]
+        with mock.patch("pyseed.seed_client.time.sleep") as mock_sleep:
+            self.seed_client.track_progress_result("key", wait=10)
+        client.get.assert_called_with(None, required_pk=False, endpoint="progress", url_args={"PROGRESS_KEY": "key"}, wait=10)
+        assert mock_sleep.call_count == 1
+
+    def test_track_progress_result_async(self):
+        client = self.seed_client.client
+        client.get.side_effect = [{"progress": 10}, requests.ConnectionError("connection reset"), {"progress": 100}]
+        assert asyncio.run(self.seed_client.track_progress_result_async("key", interval=0))["progress"] == 100
+
+        client.get.side_effect = None
+        client.get.return_value = {"progress": 10}
+        with pytest.raises(TimeoutError):
+            asyncio.run(self.seed_client.track_progress_result_async("key", interval=0, timeout=0.01))
+
+        # repeated failures are raised
+        client.get.reset_mock()
+        client.get.side_effect = requests.ConnectionError("connection refused")
+        with pytest.raises(Exception, match="Could not get the progress"):
+            asyncio.run(self.seed_client.track_progress_result_async("key", interval=0, max_failures=3))
+        assert client.get.call_count == 3
+
+        client.get.side_effect = [SEEDError("bad gateway", status_code=502)] * 20 + [{"progress": 100}]
+        assert asyncio.run(self.seed_client.track_progress_result_async("key", interval=0))["progress"] == 100
+
+    def test_create_or_update_column_mapping_profile_from_file(self):
+        self.seed_client.create_or_update_column_mapping_profile = mock.MagicMock()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            mapping_file = Path(tmpdir) / "mappings.csv"
+            mapping_file.write_text("Raw Columns,units,SEED Table,SEED Columns,Omit\nBuilding ID,,PropertyState,custom_id_1,False\n")
+            with mock.patch("pyseed.seed_client.read_map_file", wraps=read_map_file) as mock_read:
+                self.seed_client.create_or_update_column_mapping_profile_from_file("profile", mapping_file)
+                self.seed_client.create_or_update_column_mapping_profile_from_file("profile", mapping_file)
+                assert mock_read.call_count == 1
+
+                # a changed file is read again
+                mapping_file.write_text("Raw Columns,units,SEED Table,SEED Columns,Omit\n")
+                self.seed_client.create_or_update_column_mapping_profile_from_file("profile", mapping_file)
+                assert mock_read.call_count == 2
+        mappings = self.seed_client.create_or_update_column_mapping_profile.call_args_list[0][0][1]
+        assert mappings[0]["to_field"] == "custom_id_1"
+
+    def test_cycles_cache(self):
+        client = self.seed_client.client
+        client.org_id = ORGANIZATION_ID
+        client.list.return_value = {"cycles": [{"id": 1, "name": "2021"}]}
+        client.post.return_value = {"cycles": {"id": 2, "name": "2022"}}
+
+        assert self.seed_client.get_cycle_by_name("2021")["id"] == 1
+        self.seed_client.get_or_create_cycle("2021", date(2021, 1, 1), date(2021, 12, 31))
+        client.list.assert_called_once_with(endpoint="cycles")
+
+        # creating a cycle refetches the cycles
+        self.seed_client.create_cycle("2022", date(2022, 1, 1), date(2022, 12, 31))
+        self.seed_client.get_cycles()
+        assert client.list.call_count == 2
+
+        # expired results are refetched
+        with mock.patch.object(SeedClient, "CACHE_TTL", 0):
+            self.seed_client.get_cycles()
+        assert client.list.call_count == 3
+
+        # the cached cycles are not changed by the caller
+        cycles = self.seed_client.get_cycles()
+        cycles[0]["name"] = "changed"
+        cycles.clear()
+        self.seed_client.get_cycle_by_name("2021")["id"] = 5
+        assert self.seed_client.get_cycles() == [{"id": 1, "name": "2021"}]
+
+    def test_create_extra_data_columns_from_file(self):
+        client = self.seed_client.client
+        client.list.return_value = {
+            "columns": [
+                {"column_name": "pathway", "is_extra_data": True},
+                {"column_name": "completion_date", "is_extra_data": False},
+            ],
+        }
+        client.post.side_effect = lambda **kwargs: {"status": "success", "column": {"name": kwargs["json"]["column_name"]}}
+
+        results = self.seed_client.create_extra_data_columns_from_file("tests/data/test-seed-create-columns.csv")
+        with open("tests/data/test-seed-create-columns.csv") as f:
+            names = [line.split(",")[0] for line in f.readlines()[1:]]
+        assert [result.get("column", {}).get("name") for result in results] == [None if name == "pathway" else name for name in names]
+        assert results[names.index("pathway")]["status"] == "noop"
+        # the existing columns are listed once for the whole file
+        client.list.assert_called_once_with(endpoint="columns")
+        assert client.post.call_count == len(names) - 1
+
+        # creating columns drops the cached columns, existing columns are found in the cache
+        self.seed_client.get_columns()
+        assert client.list.call_count == 2
+        for _ in range(2):
+            result = self.seed_client.create_extra_data_column("pathway", "Pathway", "Property", "Pathway", "string")
+            assert result["status"] == "noop"
+        self.seed_client.get_columns()
+        assert client.list.call_count == 2
+
+        # the cached columns are not changed by the caller
+        columns = self.seed_client.get_columns()["columns"]
+        num_columns = len(columns)
+        columns.clear()
+        assert len(self.seed_client.get_columns()["columns"]) == num_columns > 0
+
+    def test_create_extra_data_columns_from_file_blank_lines(self):
+        client = self.seed_client.client
+        client.list.return_value = {"columns": []}
+        client.post.side_effect = lambda **kwargs: {"status": "success", "column": {"name": kwargs["json"]["column_name"]}}
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cols_file = Path(tmpdir) / "columns.csv"
+            cols_file.write_text(
+                "column_name,display_name,column_description,inventory_type,data_type\n"
+                "pathway,Pathway,Pathway,Property,string\n"
+                "\n"
+                "stage,Stage,Stage,Property,string\n"
+                "\n",
+            )
+            results = self.seed_client.create_extra_data_columns_from_file(str(cols_file))
+        # blank lines are skipped
+        assert [result["column"]["name"] for result in results] == ["pathway", "stage"]
+        assert client.post.call_count == 2
+
+    def test_create_extra_data_columns_from_file_validation(self):
+        client = self.seed_client.client
+        header = "column_name,display_name,column_description,inventory_type,data_type\n"
+        bad_files = {
+            "column_name,display_name,inventory_type,data_type\nfoo,Foo,Property,string\n": "missing the headers: column_description",
+            header + "foo,Foo,Foo,Property,string\nbar,Bar,Property,string\n": "Line 3",
+        }
+        with tempfile.TemporaryDirectory() as tmpdir:
+            columns_file = Path(tmpdir) / "columns.csv"
+            for content, message in bad_files.items():
+                columns_file.write_text(content)
+                with pytest.raises(ValueError, match=message):
+                    self.seed_client.create_extra_data_columns_from_file(columns_file)
+            # nothing is sent to SEED for a bad file
+            assert client.method_calls == []
+
+            # unknown types are warned about, and still sent as SEED may accept them
+            client.list.return_value = {"columns": []}
+            client.post.return_value = {"status": "success"}
+            columns_file.write_text(header + "foo,Foo,Foo,Building,string\nbar,Bar,Bar,Taxlot,text\n")
+            with self.assertLogs("pyseed.seed_client", level="WARNING") as logs:
+                self.seed_client.create_extra_data_columns_from_file(columns_file)
+        assert "unknown inventory_type 'Building'" in logs.output[0]
+        assert "unknown data_type 'text'" in logs.output[1]
+        assert client.post.call_count == 2
+
+    def test_get_or_create_meter(self):
+        client = self.seed_client.client
+        client.org_id = ORGANIZATION_ID
+        client.get.return_value = [
+            {"id": 1, "type": "Electric", "source": "Portfolio Manager", "source_id": "1"},
+            {"id": 2, "type": "Natural Gas", "source": "Portfolio Manager", "source_id": "1"},
+        ]
+        client.post.return_value = {"id": 3, "type": "Electric", "source": "Portfolio Manager", "source_id": "2"}
+
+        for source_id, meter_id in [("1", 1), ("1", 1), ("2", 3)]:
+            assert self.seed_client.get_or_create_meter(11, "Electric", "Portfolio Manager", source_id)["id"] == meter_id
+        assert self.seed_client.get_meter(11, "Natural Gas", "Portfolio Manager", "1")["id"] == 2
+        # the meters are listed once, the created meter is added to them
+        assert client.get.call_count == 1
+        client.post.assert_called_once()
+        assert self.seed_client.get_meter(11, "Electric", "Portfolio Manager", "2")["id"] == 3
+
+        # the cached meters are not changed by the caller
+        self.seed_client.get_meter(11, "Electric", "Portfolio Manager", "1")["id"] = 7
+        client.post.return_value["id"] = 8
+        assert self.seed_client.get_meter(11, "Electric", "Portfolio Manager", "1")["id"] == 1
+        assert self.seed_client.get_meter(11, "Electric", "Portfolio Manager", "2")["id"] == 3
+
+        # deleted meters are removed
+        self.seed_client.delete_meter(11, 2)
+        assert self.seed_client.get_meter(11, "Natural Gas", "Portfolio Manager", "1") is None
+        assert client.get.call_count == 1
+
+        # the meters are kept per property
+        assert self.seed_client.get_meter(12, "Electric", "Portfolio Manager", "1")["id"] == 1
+        assert client.get.call_count == 2
+        self.seed_client.invalidate_meters_cache(12)
+        self.seed_client.get_meter(12, "Electric", "Portfolio Manager", "1")
+        self.seed_client.get_meter(11, "Electric", "Portfolio Manager", "1")
+        assert client.get.call_count == 3
+
+        # meters imported from an ESPM file are fetched again
+        with tempfile.TemporaryDirectory() as tmpdir:
+            espm_file = Path(tmpdir) / "espm.xlsx"
+            espm_file.write_bytes(b"xlsx")
+            self.seed_client.import_portfolio_manager_property(11, 2, 3, str(espm_file))
+        self.seed_client.get_meter(11, "Electric", "Portfolio Manager", "1")
+        self.seed_client.get_meter(12, "Electric", "Portfolio Manager", "1")
+        assert client.get.call_count == 4
+
+    def test_map_properties(self):
+        client = self.seed_client.client
+        client.get.side_effect = lambda *_args, **kwargs: [{"property": kwargs["url_args"]["PK"]}]
+        assert self.seed_client.get_meters_bulk([3, 1, 2], max_workers=2) == [[{"property": pk}] for pk in [3, 1, 2]]
+        assert self.seed_client.map_properties(str, [1, 2]) == ["1", "2"]
+
+    def test_get_or_create_label_async(self):
+        client = self.seed_client.client
+        client.org_id = ORGANIZATION_ID
+        client.list.return_value = []
+        client.post.return_value = {"id": 5, "name": "Violation"}
+
+        async def create_concurrently():
+            return await asyncio.gather(*(self.seed_client.get_or_create_label_async("Violation") for _ in range(4)))
+
+        assert asyncio.run(create_concurrently()) == [client.post.return_value] * 4
+        client.post.assert_called_once_with(endpoint="labels", json={"name": "Violation", "color": "blue", "show_in_list": False})
+        assert self.seed_client._label_tasks == {}
+
+    def test_create_buildings(self):
+        client = self.seed_client.client
+        client.get.return_value = []
+        client.post.side_effect = lambda **kwargs: {"view_id": kwargs["json"]["state"]["custom_id_1"]}
+        params_list = [{"cycle_id": 1, "state": {"custom_id_1": str(i)}} for i in range(5)]
+
+        results = self.seed_client.create_buildings(params_list, max_workers=3)
+        assert [result["view_id"] for result in results] == ["0", "1", "2", "3", "4"]
+        assert client.get.call_count == 5
+
+        # duplicates within the batch are caught before creating anything
+        client.post.reset_mock()
+        with pytest.raises(Exception, match="More than one property"):
+            self.seed_client.create_buildings([params_list[0], {"cycle_id": 1, "state": {"pm_property_id": "0"}}])
+        client.post.assert_not_called()
+
+    def test_get_org_by_name(self):
+        client = self.seed_client.client
+        client.list.return_value = [{"id": 1, "name": "test-org"}, {"id": 2, "name": "other-org"}]
+
+        assert self.seed_client.get_org_by_name("test-org")["id"] == 1
+        with pytest.raises(ValueError, match="not found"):
+            self.seed_client.get_org_by_name("missing-org")
+        assert self.seed_client.get_org_by_name("other-org", set_org_id=True)["id"] == 2
+        assert client.org_id == 2
+        client.list.assert_called_once_with(endpoint="organizations", data_name="organizations", brief="true")
+
+        # the cached organizations are not changed by the caller
+        self.seed_client.get_org_by_name("test-org")["name"] = "changed"
+        orgs = self.seed_client.get_organizations()
+        orgs[1]["id"] = 5
+        orgs.pop()
+        assert self.seed_client.get_organizations() == [{"id": 1, "name": "test-org"}, {"id": 2, "name": "other-org"}]
+
+    def test_instance_information(self):
+        client = self.seed_client.client
+        client.base_url = "127.0.0.1:8000/"
+        client.username = "user@seed-platform.org"
+        client.get.return_value = {"version": "2.20.0", "sha": "abc"}
+        for _ in range(2):
+            info = self.seed_client.instance_information()
+            assert info == {"version": "2.20.0", "sha": "abc", "host": "127.0.0.1:8000/", "username": "user@seed-platform.org"}
+        client.get.assert_called_once_with(None, required_pk=False, endpoint="version", data_name="all")
+        # the cached version is not changed by the caller
+        info["version"] = "changed"
+        assert self.seed_client.instance_information()["version"] == "2.20.0"
+
+    def test_create_organization(self):
+        client = self.seed_client.client
+        client.username = "User@SEED-platform.org"
+        client.list.side_effect = lambda endpoint, **_kwargs: (
+            [{"id": 1, "name": "Test-Org"}]
+            if endpoint == "organizations"
+            else {"users": [{"email": "user@seed-platform.org", "user_id": 7}]}
+        )
+        with pytest.raises(Exception, match="already exists"):
+            self.seed_client.create_organization("test-org")
+
+        self.seed_client.create_organization("new-org")
+        client.post.assert_called_once_with(endpoint="organizations", json={"user_id": 7, "organization_name": "new-org"})
+
+    def test_update_labels_of_buildings_bulk(self):
+        client = self.seed_client.client
+        client.org_id = ORGANIZATION_ID
+        client.list.return_value = [{"id": 3, "name": "Violation"}, {"id": 16, "name": "Complied"}]
+
+        results = self.seed_client.update_labels_of_buildings_bulk(
+            [
+                {"add_label_names": ["Violation"], "remove_label_names": [], "building_ids": [1, 2]},
+                {"add_label_names": ["Complied"], "remove_label_names": ["Violation"], "building_ids": [3]},
+                {"add_label_names": ["Violation"], "building_ids": [4]},
+            ],
+        )
+        assert len(results) == 2
+        client.list.assert_called_once_with(endpoint="labels")
+        client.put.assert_any_call(
+            None,
+            required_pk=False,
+            endpoint="labels_property",
+            json={"inventory_ids": [1, 2, 4], "add_label_ids": [3], "remove_label_ids": []},
+        )
+
+    def test_get_or_create_label(self):
+        client = self.seed_client.client
+        client.org_id = ORGANIZATION_ID
+        client.list.return_value = [{"id": 3, "name": "Violation"}]
+        assert self.seed_client.get_or_create_label("Violation")["id"] == 3
+        client.post.assert_not_called()
+
+        # the cached label is not changed by the caller
+        self.seed_client.get_or_create_label("Violation")["color"] = "red"
+        assert self.seed_client.get_labels() == [{"id": 3, "name": "Violation"}]
+
+        # a created label is in the labels fetched afterwards
+        client.post.return_value = {"id": 5, "name": "New"}
+        client.list.return_value = [{"id": 3, "name": "Violation"}, {"id": 5, "name": "New"}]
+        assert self.seed_client.get_or_create_label("New")["id"] == 5
+        assert self.seed_client.get_labels() == client.list.return_value
+
+        # created by someone else after the labels were cached
+        client.post.side_effect = SEEDError("label with this name already exists")
+        self.seed_client.invalidate_labels_cache()
+        client.list.side_effect = [[{"id": 3, "name": "Violation"}], [{"id": 3, "name": "Violation"}, {"id": 4, "name": "Complied"}]]
+        assert self.seed_client.get_or_create_label("Complied")["id"] == 4
+
+        client.list.side_effect = None
+        with pytest.raises(SEEDError):
+            self.seed_client.get_or_create_label("Missing")
+
+        # invalid colors are rejected before calling SEED
+        client.post.reset_mock()
+        with pytest.raises(ValueError, match="Label color must be one of"):
+            self.seed_client.get_or_create_label("Missing", color="purple")
+        with pytest.raises(ValueError, match="Label color must be one of"):
+            self.seed_client.update_label("Violation", new_color="purple")
+        client.post.assert_not_called()
+        client.put.assert_not_called()
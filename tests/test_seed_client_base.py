@@ -4,6 +4,7 @@ See also https://github.com/seed-platform/py-seed/main/LICENSE
 """
 
 import json
+import sys
 import unittest
 from unittest import mock
 
@@ -16,6 +17,8 @@ from pyseed.seed_client_base import (
     SEEDBaseClient,
     SEEDOAuthReadWriteClient,
     SEEDReadWriteClient,
+    _decode_json,
+    json_dumps,
 )
 
 # Constants
@@ -140,7 +143,7 @@ class SEEDClientErrorHandlingTests(unittest.TestCase):
         """
         url = "http://example.org/api/v3/test/"
         # Old SEED Style 200 (sic) with error message
-        mock_requests.get.return_value = get_mock_response(data="No llama!", error=True)
+        mock_requests.Session.return_value.get.return_value = get_mock_response(data="No llama!", error=True)
         with pytest.raises(SEEDError) as conm:
             self.client.get(1)
 
@@ -152,7 +155,12 @@ class SEEDClientErrorHandlingTests(unittest.TestCase):
         assert conm.value.status_code == 200
 
         # newer/correct using status codes (no message)
-        mock_requests.get.return_value = get_mock_response(status_code=404, data="No llama!", error=True, content=False)
+        mock_requests.Session.return_value.get.return_value = get_mock_response(
+            status_code=404,
+            data="No llama!",
+            error=True,
+            content=False,
+        )
         with pytest.raises(SEEDError) as conm:
             self.client.get(1)
 
@@ -164,7 +172,7 @@ class SEEDClientErrorHandlingTests(unittest.TestCase):
         assert conm.value.status_code == 404
 
         # newer/correct using status codes (with message)
-        mock_requests.get.return_value = get_mock_response(status_code=404, data="No llama!", error=True, content=True)
+        mock_requests.Session.return_value.get.return_value = get_mock_response(status_code=404, data="No llama!", error=True, content=True)
         with pytest.raises(SEEDError) as conm:
             self.client.get(1)
 
@@ -209,6 +217,23 @@ class SEEDClientMethodTests(unittest.TestCase):
         result = self.client._get_result(response)
         assert result == "test"
 
+    def test_decode_json(self):
+        """Test the response body is decoded from its raw content."""
+        response = get_mock_response(data="test")
+        response.json.return_value = None
+        with mock.patch("pyseed.seed_client_base.json_loads", json.loads):
+            assert _decode_json(response) == {"status": "success", "data": "test"}
+
+        # without orjson fall back to the response's own decoder
+        with mock.patch("pyseed.seed_client_base.json_loads", None):
+            assert _decode_json(response) is None
+
+    def test_json_encoder(self):
+        """Test json bodies are serialized with orjson when it is installed."""
+        assert self.client.json_encoder is json_dumps
+        if json_dumps is not None:
+            assert json.loads(json_dumps({1: "one", "two": [2]})) == {"1": "one", "two": [2]}
+
 
 @mock.patch("pyseed.apibase.requests")
 class MixinTests(unittest.TestCase):
@@ -226,6 +251,8 @@ class MixinTests(unittest.TestCase):
             port=self.port,
             url_map=self.urls_map,
             oauth_client=MockOAuthClient,
+            # let requests serialize the json bodies
+            json_encoder=None,
         )
         self.call_dict = {
             "headers": {"Authorization": "Bearer dfghjk"},
@@ -238,28 +265,28 @@ class MixinTests(unittest.TestCase):
     def test_delete(self, mock_requests):
         # pylint:disable=no-member
         url = "https://example.org:1337/api/v3/test/1/"
-        mock_requests.delete.return_value = get_mock_response(status_code=requests.codes.no_content)
+        mock_requests.Session.return_value.delete.return_value = get_mock_response(status_code=requests.codes.no_content)
         result = self.client.delete(1, endpoint="test1")
         assert None is result
-        mock_requests.delete.assert_called_with(url, **self.call_dict)
+        mock_requests.Session.return_value.delete.assert_called_with(url, **self.call_dict)
 
     def test_get(self, mock_requests):
         url = "https://example.org:1337/api/v3/test/1/"
-        mock_requests.get.return_value = get_mock_response(data="Llama!")
+        mock_requests.Session.return_value.get.return_value = get_mock_response(data="Llama!")
         result = self.client.get(1, endpoint="test1")
         assert result == "Llama!"
-        mock_requests.get.assert_called_with(url, **self.call_dict)
+        mock_requests.Session.return_value.get.assert_called_with(url, **self.call_dict)
 
     def test_list(self, mock_requests):
         url = "https://example.org:1337/api/v3/test/"
-        mock_requests.get.return_value = get_mock_response(data=["Llama!"])
+        mock_requests.Session.return_value.get.return_value = get_mock_response(data=["Llama!"])
         result = self.client.list(endpoint="test1")
         assert result == ["Llama!"]
-        mock_requests.get.assert_called_with(url, **self.call_dict)
+        mock_requests.Session.return_value.get.assert_called_with(url, **self.call_dict)
 
     def test_patch(self, mock_requests):
         url = "https://example.org:1337/api/v3/test/1/"
-        mock_requests.patch.return_value = get_mock_response(data="Llama!")
+        mock_requests.Session.return_value.patch.return_value = get_mock_response(data="Llama!")
         result = self.client.patch(1, endpoint="test1", foo="bar", json={"more": "data"})
         assert result == "Llama!"
 
@@ -272,11 +299,11 @@ class MixinTests(unittest.TestCase):
             "json": {"more": "data"},
             "timeout": None,
         }
-        mock_requests.patch.assert_called_with(url, **expected)
+        mock_requests.Session.return_value.patch.assert_called_with(url, **expected)
 
     def test_put(self, mock_requests):
         url = "https://example.org:1337/api/v3/test/1/"
-        mock_requests.put.return_value = get_mock_response(data="Llama!")
+        mock_requests.Session.return_value.put.return_value = get_mock_response(data="Llama!")
         result = self.client.put(1, endpoint="test1", foo="bar", json={"more": "data"})
         assert result == "Llama!"
 
@@ -289,11 +316,11 @@ class MixinTests(unittest.TestCase):
             "json": {"more": "data"},
             "timeout": None,
         }
-        mock_requests.put.assert_called_with(url, **expected)
+        mock_requests.Session.return_value.put.assert_called_with(url, **expected)
 
     def test_post(self, mock_requests):
         url = "https://example.org:1337/api/v3/test/"
-        mock_requests.post.return_value = get_mock_response(data="Llama!")
+        mock_requests.Session.return_value.post.return_value = get_mock_response(data="Llama!")
         result = self.client.post(endpoint="test1", json={"foo": "bar", "not_org": 1})
         assert result == "Llama!"
         expected = {
@@ -304,7 +331,41 @@ class MixinTests(unittest.TestCase):
             "json": {"not_org": 1, "foo": "bar"},
             "timeout": None,
         }
-        mock_requests.post.assert_called_with(url, **expected)
+        mock_requests.Session.return_value.post.assert_called_with(url, **expected)
+
+        # streamed responses are checked and returned as is
+        response = get_mock_response(data="Llama!")
+        mock_requests.Session.return_value.post.return_value = response
+        assert self.client.post(endpoint="test1", json={"foo": "bar"}, stream=True) is response
+        assert mock_requests.Session.return_value.post.call_args[1]["stream"] is True
+
+    def test_post_in_chunks(self, mock_requests):
+        url = "https://example.org:1337/api/v3/test/"
+        session = mock_requests.Session.return_value
+        session.post.side_effect = [get_mock_response(data=[{"id": 1}, {"id": 2}]), get_mock_response(data=[{"id": 3}])]
+        readings = [{"reading": 1}, {"reading": 2}, {"reading": 3}]
+        result = self.client.post(endpoint="test1", json=readings, chunk_size=2)
+        assert result == [{"id": 1}, {"id": 2}, {"id": 3}]
+        assert session.post.call_count == 2
+        session.post.assert_called_with(url, **{**self.call_dict, "json": [{"reading": 3}]})
+
+        # results of calls that are not lists are collected as they are
+        session.post.side_effect = [get_mock_response(data={"created": 2}), get_mock_response(data={"created": 1})]
+        assert self.client.post(endpoint="test1", json=readings, chunk_size=2) == [{"created": 2}, {"created": 1}]
+
+        with pytest.raises(ValueError, match="json array"):
+            self.client.post(endpoint="test1", chunk_size=2)
+
+        # the chunks after a failed chunk are not sent
+        session.post.reset_mock()
+        session.post.side_effect = [
+            get_mock_response(data=[{"id": 1}]),
+            get_mock_response(status_code=400, error=True),
+            get_mock_response(data=[{"id": 3}]),
+        ]
+        with pytest.raises(SEEDError):
+            self.client.post(endpoint="test1", json=readings, chunk_size=1)
+        assert session.post.call_count == 2
 
 
 @mock.patch("pyseed.apibase.requests")
@@ -333,12 +394,49 @@ class SEEDReadWriteClientTests(unittest.TestCase):
 
     def test_get(self, mock_requests):
         # url = 'https://example.org:1337/api/v3/test/1/'
-        mock_requests.get.return_value = get_mock_response(data="Llama!")
+        mock_requests.Session.return_value.get.return_value = get_mock_response(data="Llama!")
         result = self.client.get(1, endpoint="test1")
         assert result == "Llama!"
 
     def test_list(self, mock_requests):
         # url = 'https://example.org:1337/api/v3/test/'
-        mock_requests.get.return_value = get_mock_response(data=["Llama!"])
+        mock_requests.Session.return_value.get.return_value = get_mock_response(data=["Llama!"])
         result = self.client.list(endpoint="test1")
         assert result == ["Llama!"]
+
+    def test_post_stream_error_httpx(self, mock_requests):
+        """Test errors to streamed calls are read and raised on the httpx backend."""
+
+        class StreamedResponse:
+            """httpx response whose body is only available once read"""
+
+            status_code = 400
+
+            def __init__(self):
+                self.headers = {"Content-Type": "application/json"}
+                self.request = mock.MagicMock(url="https://example.org:1337/api/v3/portfolio_manager/1/download/", method="POST")
+                self.is_read = self.is_closed = False
+
+            @property
+            def content(self):
+                if not self.is_read:
+                    raise RuntimeError("Attempted to access streaming response content, without having called `read()`.")
+                return b'{"status": "error", "message": "Invalid ESPM credentials"}'
+
+            def json(self):
+                return json.loads(self.content)
+
+            def read(self):
+                self.is_read = True
+
+            def close(self):
+                self.is_closed = True
+
+        mock_httpx = mock.MagicMock()
+        response = StreamedResponse()
+        mock_httpx.Client.return_value.send.return_value = response
+        client = SEEDReadWriteClient(1, username="test@example.org", api_key="dfghjk", base_url=self.base_url, port=self.port, backend="httpx")
+        with mock.patch.dict(sys.modules, {"httpx": mock_httpx}), pytest.raises(SEEDError, match="Invalid ESPM credentials"):
+            client.post("portfolio_manager_property_download", url_args={"PK": 1}, json={"username": "user"}, stream=True)
+        assert response.is_closed
+        mock_requests.Session.assert_not_called()
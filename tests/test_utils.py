@@ -3,9 +3,12 @@ SEED Platform (TM), Copyright (c) Alliance for Sustainable Energy, LLC, and othe
 See also https://github.com/seed-platform/py-seed/main/LICENSE
 """
 
+import tempfile
 import unittest
 from pathlib import Path
 
+import pytest
+
 from pyseed.utils import read_map_file
 
 
@@ -22,3 +25,14 @@ class UtilsTest(unittest.TestCase):
             "is_omitted": False,
         }
         assert mappings[5] == expected
+
+    def test_mapping_file_invalid_row(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            mapfile = Path(tmpdir) / "mappings.csv"
+            mapfile.write_text("Raw Columns,units,SEED Table,SEED Columns,Omit\nBuilding ID,,PropertyState\n")
+            with pytest.raises(ValueError, match="Line 2"):
+                read_map_file(mapfile)
+
+            # blank lines are skipped
+            mapfile.write_text("Raw Columns,units,SEED Table,SEED Columns,Omit\n\nBuilding ID,,PropertyState,custom_id_1\n\n")
+            assert [mapping["to_field"] for mapping in read_map_file(mapfile)] == ["custom_id_1"]